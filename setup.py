@@ -100,6 +100,7 @@ setup(
     },
     package_data={
         "src": ["assets/*"],
+        "src.gui": ["styles/*.qss"],
     },
     include_package_data=True,
     zip_safe=False,
@@ -7,7 +7,6 @@ import platform
 from src.core.disk_manager import DiskManager
 from src.core.usb_creator import USBCreator
 from src.core.safety import SafetyManager
-import time
 import sys
 from colorama import init, Fore, Style
 
@@ -163,8 +162,9 @@ def create_bootable_usb(iso_path, device, method):
     
     # Wait for the process to finish
     try:
-        while usb_creator.is_running:
-            time.sleep(0.5)
+        # Wait in short steps so Ctrl+C is handled promptly on every platform
+        while not usb_creator.wait(0.5):
+            pass
         
         # Final status
         if usb_creator.progress == 100:
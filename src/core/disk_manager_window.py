@@ -4,6 +4,7 @@ import os
 import platform
 import ctypes
 import re
+import threading
 from ctypes import windll, wintypes
 from .safety import SafetyManager
 
@@ -18,13 +19,30 @@ except ImportError:
 class DiskManager:
     def __init__(self):
         self.safety = SafetyManager()
-        # Initialize WMI for Windows only to avoid errors on other platforms
-        if platform.system() == "Windows":
+        # COM objects can't be shared between threads, so every thread gets its own WMI
+        # connection, created on first use (see wmi_conn)
+        self._wmi_local = threading.local()
+            
+    @property
+    def wmi_conn(self):
+        """
+        WMI connection for the calling thread, created on first use
+        
+        COM stays initialized for the rest of the thread's life so that later calls
+        from the same thread reuse the connection. Thread pool threads are not told
+        before they exit, so their COM apartment is released by Windows together with
+        the thread instead of by CoUninitialize(). Only the thread that destroys the
+        DiskManager uninitializes COM explicitly, see __del__().
+        """
+        if not hasattr(self._wmi_local, 'conn'):
+            self._wmi_local.com_initialized = False
             try:
                 pythoncom.CoInitialize()  # Initialize COM for the current thread
-                self.wmi_conn = wmi.WMI()
+                self._wmi_local.com_initialized = True
+                self._wmi_local.conn = wmi.WMI()
             except:
-                self.wmi_conn = None
+                self._wmi_local.conn = None
+        return self._wmi_local.conn
     
     def list_physical_disks(self):
         """List all physical disk devices (not partitions) on Windows"""
@@ -250,8 +268,12 @@ class DiskManager:
             return False
     
     def __del__(self):
-        """Clean up WMI connection when object is destroyed"""
-        if platform.system() == "Windows":
+        """Clean up the WMI connection of the current thread when object is destroyed"""
+        # Only balance a CoInitialize() this thread actually made in wmi_conn
+        local = getattr(self, '_wmi_local', None)
+        if getattr(local, 'com_initialized', False):
+            local.conn = None
+            local.com_initialized = False
             try:
                 pythoncom.CoUninitialize()  # Clean up COM for the current thread
             except:
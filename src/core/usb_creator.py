@@ -1,6 +1,5 @@
 
 import os
-import time
 import subprocess
 import platform
 import shutil
@@ -21,6 +20,9 @@ class USBCreator:
         self._status = "Idle"
         self._running = False
         self._thread = None
+        # Set whenever no creation thread is running
+        self._done = threading.Event()
+        self._done.set()
     
     @property
     def status(self):
@@ -56,33 +58,82 @@ class USBCreator:
         Returns:
             bool: True if successful, False otherwise
         """
+        method = self._prepare_creation(iso_path, target_device, method)
+        if method is None:
+            return False
+        
+        # Start the creation in a separate thread to not block the UI
+        self._thread = threading.Thread(
+            target=self._create_bootable_usb_thread,
+            args=(iso_path, target_device, method, callback),
+            daemon=True
+        )
+        self._running = True
+        self._done.clear()
+        self._thread.start()
+        return True
+    
+    def run_bootable_usb(self, iso_path, target_device, method='dd', callback=None):
+        """
+        Create a bootable USB from an ISO file in the calling thread
+        
+        Takes the same arguments as create_bootable_usb(), but blocks until the
+        process has finished instead of starting a separate thread. Intended for
+        callers that already run in a worker thread and have asked the user for
+        confirmation themselves, so no confirmation is requested here.
+        
+        Returns:
+            bool: True if the bootable USB was created successfully, False otherwise
+        """
+        method = self._prepare_creation(iso_path, target_device, method, confirm=False)
+        if method is None:
+            return False
+        
+        self._running = True
+        self._done.clear()
+        return self._create_bootable_usb_thread(iso_path, target_device, method, callback)
+    
+    def _prepare_creation(self, iso_path, target_device, method, confirm=True):
+        """
+        Validate a USB creation request and resolve the creation method
+        
+        Args:
+            confirm (bool): Whether to ask the user for confirmation via SafetyManager
+        
+        Returns:
+            str: The method to use, or None if the request was rejected (see status)
+        """
         if not os.path.exists(iso_path):
             self._status = f"Error: ISO file not found: {iso_path}"
-            return False
+            return None
         
         # Check if it's safe to write to the target device
         if not self.safety.is_safe_device(target_device):
             self._status = f"Error: Cannot write to system device: {target_device}"
-            return False
+            return None
         
         # Get confirmation from the user via SafetyManager
-        if not self.safety.get_confirmation(target_device, "create bootable USB"):
+        if confirm and not self.safety.get_confirmation(target_device, "create bootable USB"):
             self._status = "Operation cancelled by user"
-            return False
+            return None
         
         # Determine the best method if 'auto' is selected
         if method == 'auto':
             method = self._determine_best_method(iso_path)
         
-        # Start the creation in a separate thread to not block the UI
-        self._thread = threading.Thread(
-            target=self._create_bootable_usb_thread,
-            args=(iso_path, target_device, method, callback),
-            daemon=True
-        )
-        self._running = True
-        self._thread.start()
-        return True
+        return method
+    
+    def wait(self, timeout=None):
+        """
+        Block until the current USB creation process has finished
+        
+        Args:
+            timeout (float): Optional maximum number of seconds to wait
+        
+        Returns:
+            bool: True if no process is running anymore, False if the timeout expired
+        """
+        return self._done.wait(timeout)
     
     def cancel(self):
         """Cancel an ongoing USB creation process"""
@@ -146,7 +197,7 @@ class USBCreator:
             return True  # Assume hybrid for safety
     
     def _create_bootable_usb_thread(self, iso_path, target_device, method, callback):
-        """Thread function to create a bootable USB"""
+        """Create a bootable USB (runs in the creation thread, or inline from run_bootable_usb)"""
         try:
             self._update_progress(0, f"Starting USB creation with {method} method", callback)
             
@@ -176,6 +227,7 @@ class USBCreator:
             return False
         finally:
             self._running = False
+            self._done.set()
     
     def _unmount_device(self, device_path):
         """Unmount all partitions of a device before writing to it"""
@@ -245,7 +297,11 @@ class USBCreator:
                     except:
                         pass
                 
-                time.sleep(0.5)
+                # Returns as soon as dd exits instead of sleeping out the full interval
+                try:
+                    process.wait(timeout=0.5)
+                except subprocess.TimeoutExpired:
+                    pass
                 
             # Check if process completed successfully
             if not self._running:
@@ -309,7 +365,10 @@ class USBCreator:
             # This is simplified - in a real implementation you would 
             # report progress as the file is written
             while process.poll() is None and self._running:
-                time.sleep(1)
+                try:
+                    process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    pass
                 
             if not self._running:
                 process.terminate()
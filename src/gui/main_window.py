@@ -3,87 +3,599 @@
 
 import sys
 import os
+import io
+import platform
+import psutil
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                             QWidget, QPushButton, QTableWidget, QTableWidgetItem, 
                             QTabWidget, QComboBox, QLabel, QFileDialog, QTextEdit,
                             QProgressBar, QMessageBox, QGroupBox, QCheckBox,
-                            QSplitter, QFrame, QStyledItemDelegate, QStyle, QStyleOptionViewItem)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QBrush
+                            QSplitter, QFrame, QStyledItemDelegate, QStyle, QStyleOptionViewItem,
+                            QHeaderView, QTableView)
+from PyQt6.QtCore import (Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer, QTime, QFile,
+                          QIODevice, QSignalBlocker, QAbstractTableModel, QModelIndex)
+from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QBrush, QStandardItemModel, QStandardItem
+import re
 import threading
 import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Admin check through the shell32 API (Windows only)
+if platform.system() == "Windows":
+    import ctypes
+else:
+    ctypes = None
+
+# udev hotplug monitoring (Linux only)
+pyudev = None
+if platform.system() == "Linux":
+    try:
+        import pyudev
+    except ImportError:
+        pass
 
 from src.core.disk_manager import DiskManager
 from src.core.usb_creator import USBCreator
 from src.core.safety import SafetyManager
 
 
-class OperationThread(QThread):
-    """Thread for running disk operations in the background"""
+# Partition number suffix of a device path: /dev/sda1, /dev/nvme0n1p1, /dev/disk2s1
+_PARTITION_SUFFIX_RE = re.compile(r'(?:p?\d+|s\d+)$')
+
+# Distribution names recognized in ISO file names (no word boundaries: "archlinux", "linuxmint")
+_DISTRO_RE = re.compile(
+    r'(ubuntu|debian|fedora|mint|arch|centos|manjaro|kali|tails|opensuse|'
+    r'elementary|zorin|puppy|lubuntu|xubuntu)',
+    re.IGNORECASE
+)
+
+# Human-readable size strings as reported by lsblk, diskutil and WMI, with binary multipliers
+_SIZE_RE = re.compile(r'\s*([\d.]+)\s*([KMGTP]?)(?:i?B)?\s*$', re.IGNORECASE)
+_SIZE_MULT = {'': 1, 'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40, 'P': 1 << 50}
+
+# Size thresholds used by _humanize_bytes()
+_KIB = 1 << 10
+_MIB = 1 << 20
+_GIB = 1 << 30
+# Units used by DiskForgeMainWindow.format_bytes(), one per power of 1024
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _humanize_bytes(n):
+    """Format a file size in bytes as KB, MB or GB"""
+    if n < _MIB:
+        return f"{n / _KIB:.1f} KB"
+    if n < _GIB:
+        return f"{n / _MIB:.1f} MB"
+    return f"{n / _GIB:.2f} GB"
+
+
+# User-friendly names for filesystem types (lowercase) and well-known mountpoints
+FS_FRIENDLY = {
+    'ext4': "Linux Filesystem",
+    'ext3': "Linux Filesystem",
+    'ntfs': "Windows Filesystem",
+    'fat32': "FAT32 (Compatible)",
+    'vfat': "FAT32 (Compatible)",
+    'exfat': "exFAT (External)",
+    'apfs': "Apple Filesystem",
+    'hfs+': "Mac OS Extended",
+}
+MOUNT_FRIENDLY = {
+    '/': "System Root Directory",
+    '/boot': "Boot Files",
+    '/home': "User Home Directories",
+}
+
+# Mountpoints whose partitions are highlighted as system partitions in the partitions table
+_SYSTEM_MOUNTS = frozenset({'/', '/boot', '/efi', '/bin', '/usr', '/etc', 'C:\\', 'C:\\Windows'})
+# Mountpoints flagged as SYSTEM in the format device combo box
+_BOOT_MOUNTS = frozenset({'/', '/boot', '/efi'})
+
+
+def _partition_combo_items(partitions):
+    """Build the (display text, device) format combo box items for a partition listing"""
+    items = []
+    for part in partitions:
+        # Create descriptive text
+        desc = f"{part['device']} - {part['size']}"
+        
+        # Add filesystem type if available
+        fstype = part.get('type')
+        if fstype:
+            desc += f" ({fstype})"
+            
+        # Add mountpoint if available
+        mountpoint = part.get('mountpoint')
+        if mountpoint:
+            if mountpoint in _BOOT_MOUNTS:
+                desc += f" ⚠️ {mountpoint} (SYSTEM)"
+            else:
+                desc += f" @ {mountpoint}"
+                
+        items.append((desc, part['device']))
+    return items
+
+
+# Colors shared by the rows of the disks and partitions tables
+_COLOR_RED = QColor("#e74c3c")
+_COLOR_ORANGE = QColor("#f39c12")
+_COLOR_GREEN = QColor("#2ecc71")
+_COLOR_GRAY = QColor("#7f8c8d")
+_COLOR_LIGHT_RED = QColor("#fadbd8")
+
+# Notices shown at the bottom of the format tab device information
+_FORMAT_SYSTEM_WARNING_HTML = (
+    "<div style='background-color: #ffebeb; border: 2px solid #e74c3c; border-radius: 4px; padding: 10px; margin-top: 10px;'>"
+    "<span style='font-weight: bold; color: #e74c3c; font-size: 16px;'>⚠️ WARNING: System Drive Detected!</span><br>"
+    "This appears to be a system drive containing important operating system files. "
+    "Formatting this drive may damage your operating system and make your computer unbootable."
+    "</div>"
+)
+_FORMAT_REMOVABLE_NOTICE_HTML = (
+    "<div style='background-color: #ebfff0; border: 2px solid #2ecc71; border-radius: 4px; padding: 10px; margin-top: 10px;'>"
+    "<span style='font-weight: bold; color: #27ae60; font-size: 16px;'>✅ Removable Device</span><br>"
+    "This is a removable device that should be safe to format. Still, make sure you've backed up any important data."
+    "</div>"
+)
+_FORMAT_STORAGE_NOTICE_HTML = (
+    "<div style='background-color: #fff8eb; border: 2px solid #f39c12; border-radius: 4px; padding: 10px; margin-top: 10px;'>"
+    "<span style='font-weight: bold; color: #e67e22; font-size: 16px;'>⚠️ Storage Device</span><br>"
+    "This is a non-removable storage device. Please verify that it doesn't contain important data before formatting."
+    "</div>"
+)
+
+# Static contents and styles of the System Info tab
+_SYSINFO_DESCRIPTION = (
+    "DiskForge is a powerful disk management utility that helps you format drives and "
+    "create bootable Linux USB drives. It works across Linux, macOS, and Windows platforms "
+    "with both graphical and command-line interfaces."
+)
+_SYSINFO_FEATURES_HTML = """
+<b>Key Features:</b>
+<ul>
+  <li>Cross-platform support for Linux, macOS, and Windows</li>
+  <li>Format drives with various filesystems (ext4, FAT32, NTFS, exFAT)</li>
+  <li>Create bootable Linux USB drives from ISO images</li>
+  <li>Built-in safety features to prevent accidental data loss</li>
+  <li>Real-time progress tracking with cancellation support</li>
+  <li>Both graphical and command-line interfaces</li>
+</ul>
+"""
+_SYSINFO_APP_GROUP_CSS = "QGroupBox { background-color: #e1f5fe; border-radius: 8px; }"
+_SYSINFO_SYS_GROUP_CSS = "QGroupBox { background-color: #f5f5f5; border-radius: 8px; }"
+_SYSINFO_TEXTEDIT_CSS = """
+    QTextEdit {
+        background-color: #ffffff;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        padding: 10px;
+    }
+"""
+
+# Root directory of the DiskForge installation, shown in the System Info tab
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Application-wide stylesheet, applied once on the QApplication in run_gui()
+_STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles", "main.qss")
+
+
+def _load_stylesheet(path=_STYLESHEET_PATH):
+    """Read a .qss stylesheet, returning an empty stylesheet if it can't be opened"""
+    qss_file = QFile(path)
+    if not qss_file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+        print(f"Could not load stylesheet {path}: {qss_file.errorString()}")
+        return ""
+    try:
+        return bytes(qss_file.readAll()).decode("utf-8")
+    finally:
+        qss_file.close()
+
+
+class OperationSignals(QObject):
+    """Signals emitted by an OperationRunnable"""
     progress_updated = pyqtSignal(int, str)
     operation_finished = pyqtSignal(bool, str)
+
+
+class OperationRunnable(QRunnable):
+    """Runnable for running disk operations on the window's operation thread pool"""
+    
+    # Minimum time between two progress signals (caps UI updates at 30 per second)
+    PROGRESS_INTERVAL = 1 / 30
     
-    def __init__(self, operation_type, *args, **kwargs):
+    def __init__(self, operation_type, disk_manager, usb_creator, *args):
         super().__init__()
+        # The window keeps a reference to query is_running after the pool is done with it
+        self.setAutoDelete(False)
+        self.signals = OperationSignals()
         self.operation_type = operation_type
+        self.disk_manager = disk_manager
+        self.usb_creator = usb_creator
         self.args = args
-        self.kwargs = kwargs
-        self.disk_manager = DiskManager()
-        self.usb_creator = USBCreator()
+        self._running = False
+        self._last_emit_ts = 0.0
+        self._last_emit_payload = None
+        
+    @property
+    def is_running(self):
+        """Check if the operation has been started and has not finished yet"""
+        return self._running
+        
+    def start(self, pool):
+        """Submit the operation to a thread pool"""
+        self._running = True
+        pool.start(self)
         
     def run(self):
         try:
             if self.operation_type == "format":
                 device, filesystem = self.args
-                self.progress_updated.emit(10, f"Starting format of {device}...")
+                self.signals.progress_updated.emit(10, f"Starting format of {device}...")
                 success = self.disk_manager.format_device(device, filesystem)
-                self.progress_updated.emit(100, "Format completed")
-                self.operation_finished.emit(success, "Format operation completed" if success else "Format failed")
+                self.signals.progress_updated.emit(100, "Format completed")
+                self._finish(success, "Format operation completed" if success else "Format failed")
                 
             elif self.operation_type == "create_usb":
                 iso_path, device, method = self.args
-                progress_callback = self.kwargs.get('progress_callback')
-                
-                def thread_progress_callback(progress, status):
-                    self.progress_updated.emit(progress, status)
-                
-                success = self.usb_creator.create_bootable_usb(iso_path, device, method, thread_progress_callback)
+                # Runs the whole creation in this pool thread
+                success = self.usb_creator.run_bootable_usb(iso_path, device, method, self._relay_progress)
                 if success:
-                    # Wait for completion
-                    while self.usb_creator.is_running:
-                        time.sleep(0.1)
-                    
-                    if self.usb_creator.progress == 100:
-                        self.operation_finished.emit(True, "Bootable USB created successfully")
-                    else:
-                        self.operation_finished.emit(False, f"USB creation failed: {self.usb_creator.status}")
+                    self._finish(True, "Bootable USB created successfully")
                 else:
-                    self.operation_finished.emit(False, f"Failed to start USB creation: {self.usb_creator.status}")
+                    self._finish(False, f"USB creation failed: {self.usb_creator.status}")
                     
         except Exception as e:
-            self.operation_finished.emit(False, f"Operation failed: {str(e)}")
+            self._finish(False, f"Operation failed: {str(e)}")
+        finally:
+            self._running = False
+            
+    def _relay_progress(self, progress, status):
+        """Forward USB creator progress as signals, dropping repeated and too frequent updates"""
+        # New status texts and the final update are always forwarded, only
+        # further updates of the same status are throttled
+        payload = (progress, status)
+        now = time.monotonic()
+        last = self._last_emit_payload
+        if progress < 100 and last is not None and status == last[1] and (
+            progress == last[0] or
+            now - self._last_emit_ts < self.PROGRESS_INTERVAL
+        ):
+            return
+        self._last_emit_ts = now
+        self._last_emit_payload = payload
+        self.signals.progress_updated.emit(progress, status)
+            
+    def _finish(self, success, message):
+        """Mark the operation as finished and report the result"""
+        # Cleared before emitting so the receiving slot already sees the operation as done
+        self._running = False
+        self.signals.operation_finished.emit(success, message)
+
+    def cancel(self):
+        """Request cancellation of the running operation"""
+        if self.usb_creator.is_running:
+            self.usb_creator.cancel()
+
+
+class DiskRefreshSignals(QObject):
+    """Signals emitted by a DiskRefreshWorker"""
+    results_ready = pyqtSignal(dict)
+    refresh_failed = pyqtSignal(str)
+
+
+class DiskRefreshWorker(QRunnable):
+    """
+    Runnable that enumerates disks and partitions on the global thread pool
+    
+    Everything that needs the disk manager or the SafetyManager, including the
+    partition entries of the format combo box, is prepared here so that the UI
+    thread only has to fill in the views.
+    """
+    
+    def __init__(self, disk_manager, safety_manager):
+        super().__init__()
+        # The window keeps a reference until the results have been applied
+        self.setAutoDelete(False)
+        self.signals = DiskRefreshSignals()
+        self.disk_manager = disk_manager
+        self.safety_manager = safety_manager
+        
+    def run(self):
+        try:
+            disks = self.disk_manager.list_physical_disks()
+            device_info = {
+                disk['device']: self.safety_manager.get_device_info(disk['device'])
+                for disk in disks
+            }
+            safe_devices = {
+                disk['device']: self.safety_manager.is_safe_device(disk['device'])
+                for disk in disks
+            }
+            partitions = self.disk_manager.list_partitions()
+            self.signals.results_ready.emit({
+                'disks': disks,
+                'partitions': partitions,
+                'device_info': device_info,
+                'safe_devices': safe_devices,
+                'partition_items': _partition_combo_items(partitions),
+            })
+        except Exception as e:
+            self.signals.refresh_failed.emit(str(e))
+
+
+class DiskTableModel(QAbstractTableModel):
+    """Table model for the physical disks table, styled through item data roles"""
+    
+    HEADERS = ["Device", "Friendly Name", "Size", "Removable", "Model/Brand", "Status"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One (device, friendly_name, size, is_removable, model, status, is_safe) tuple per row
+        self._rows = []
+        self._bold_font = QFont("", -1, QFont.Weight.Bold)
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        device, friendly_name, size, is_removable, model, status, is_safe = self._rows[index.row()]
+        col = index.column()
+        has_model = bool(model and model.strip() and model != "Unknown")
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return device
+            if col == 1:
+                return friendly_name
+            if col == 2:
+                return size
+            if col == 3:
+                return "Yes" if is_removable else "No"
+            if col == 4:
+                return model if has_model else "Not available"
+            return status
+            
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if col == 3:
+                return _COLOR_GREEN if is_removable else _COLOR_GRAY
+            if col == 4 and not has_model:
+                return _COLOR_GRAY
+            if col == 5:
+                if "System" in status:
+                    return _COLOR_RED  # Red for system drives
+                if "Removable" in status:
+                    return _COLOR_GREEN  # Green for removable
+            return None
+            
+        if role == Qt.ItemDataRole.FontRole:
+            if (col == 3 and is_removable) or (col == 5 and "System" in status):
+                return self._bold_font
+            return None
+            
+        if role == Qt.ItemDataRole.BackgroundRole:
+            # Highlight system devices for safety, except the status column which has its own color
+            if not is_safe and col != 5:
+                return _COLOR_LIGHT_RED
+            return None
+            
+        if role == Qt.ItemDataRole.UserRole:
+            return device
+            
+        return None
+        
+    def device_at(self, row):
+        """Return the device path shown in a row"""
+        return self._rows[row][0]
+        
+    def set_rows(self, rows):
+        """
+        Replace the table contents
+        
+        Args:
+            rows: List of (device, friendly_name, size, is_removable, model, status, is_safe) tuples
+        """
+        if len(rows) != len(self._rows):
+            self.beginResetModel()
+            self._rows = list(rows)
+            self.endResetModel()
+            return
+            
+        # Same number of rows: only announce the rows that changed, keeping the selection
+        old_rows = self._rows
+        self._rows = list(rows)
+        last_col = len(self.HEADERS) - 1
+        for row, (old, new) in enumerate(zip(old_rows, rows)):
+            if old != new:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_col))
 
 
 class DiskForgeMainWindow(QMainWindow):
+    # Emitted whenever one of the inputs of the USB creation button changes
+    usb_inputs_changed = pyqtSignal()
+    # Emitted from the udev monitor thread when a block device is added, removed or changed
+    devices_changed = pyqtSignal()
+    
+    # Delay in milliseconds used to coalesce device information panel updates
+    INFO_UPDATE_DELAY = 100
+    
+    # Initial column widths, so the tables don't have to be measured on every refresh
+    DISKS_COLUMN_WIDTHS = (160, 200, 90, 90, 200)
+    PARTITIONS_COLUMN_WIDTHS = (160, 150, 90, 150, 200)
+    
+    # Stylesheets of the device information panels
+    _STYLE_INFO_NEUTRAL = "padding: 10px; background-color: #f8f9fa; border-radius: 4px; margin: 5px 0;"
+    _STYLE_USB_SAFE = "padding: 10px; background-color: #d4efdf; border: 1px solid #2ecc71; border-radius: 4px; margin: 5px 0;"
+    _STYLE_USB_WARN = "padding: 10px; background-color: #fef9e7; border: 1px solid #e67e22; border-radius: 4px; margin: 5px 0;"
+    _STYLE_USB_DANGER = "padding: 10px; background-color: #fadbd8; border: 2px solid #e74c3c; border-radius: 4px; margin: 5px 0;"
+    # The format tab panel is styled by main.qss through its "state" property, see _set_state()
+    
     def __init__(self):
         super().__init__()
         self.disk_manager = DiskManager()
         self.usb_creator = USBCreator()
         self.safety_manager = SafetyManager()
-        self.operation_thread = None
+        self.current_operation = None
+        # Format and USB creation block for minutes, so they get a thread of their own and
+        # never hold up the short refresh jobs on the global pool
+        self._operation_pool = QThreadPool(self)
+        self._operation_pool.setMaxThreadCount(1)
+        # Widgets of the lazily built format and USB tabs, None until the tab is first shown
+        self.format_device_combo = None
+        self.usb_device_combo = None
+        self.device_delegate = None
+        # (system section, Python and DiskForge sections) HTML, see _build_static_sysinfo_html()
+        self._static_sysinfo_html = None
         self.refresh_timer = None
+        self.device_observer = None
+        self._iso_path = None
+        # Size in bytes and modification time of the selected ISO, set by browse_iso_file()
+        self._iso_size = None
+        self._iso_mtime = None
+        self._refresh_pending = False
+        self._refresh_worker = None
+        self._refresh_again = False
+        self._format_button_update_pending = False
+        self._usb_info_pending = False
+        self._format_info_pending = False
+        # Properties of the device shown in the format tab panel, see _do_update_format_device_info()
+        self._last_info_key = None
+        # Per-refresh safety information keyed by device path, see _build_refresh_snapshot()
+        self._refresh_snapshot = {}
+        # SafetyManager.get_device_info() results, cleared at the start of every refresh
+        self._dev_info_cache = {}
+        # Disk and partition listings of the last refresh
+        self._disks_cache = None
+        self._parts_cache = None
+        # Lookup tables rebuilt together with the listings above
+        self._disk_by_device = {}
+        self._part_by_device = {}
+        self._parts_by_parent = {}
+        # Friendly names of listed disks, {device: (properties, name)}, pruned when disks disappear
+        self._friendly_name_cache = {}
+        # is_safe_device() results for display purposes, cleared at the start of every refresh
+        self._safe_device_cache = {}
+        # get_device_status() results, cleared at the start of every refresh
+        self._status_cache = {}
+        # Format combo box items for the partitions of the last refresh, see _partition_combo_items()
+        self._partition_items = None
+        # Contents of the table rows shown last, see update_disks_table()/update_partitions_table()
+        self._disk_row_sigs = []
+        self._partition_row_sigs = []
         
         self.init_ui()
+        self.setup_device_monitor()
         self.setup_refresh_timer()
         self.refresh_disk_info()
         
-    def get_friendly_device_name(self, device_path, device_info=None):
+    def _get_device_info(self, device_path):
+        """Return SafetyManager.get_device_info() for a device, cached until the next refresh"""
+        info = self._dev_info_cache.get(device_path)
+        if info is None:
+            info = self.safety_manager.get_device_info(device_path)
+            self._dev_info_cache[device_path] = info
+        return info
+        
+    def _get_disks(self):
+        """Return the physical disks listed by the last refresh, listing them now if there is none yet"""
+        if self._disks_cache is None:
+            self._set_disks(self.disk_manager.list_physical_disks())
+        return self._disks_cache
+        
+    def _get_partitions(self):
+        """Return the partitions listed by the last refresh, listing them now if there is none yet"""
+        if self._parts_cache is None:
+            self._set_partitions(self.disk_manager.list_partitions())
+        return self._parts_cache
+        
+    def _set_disks(self, disks):
+        """Store a disk listing and index it by device path"""
+        self._disks_cache = disks
+        self._disk_by_device = {disk['device']: disk for disk in disks}
+        
+    def _set_partitions(self, partitions):
+        """Store a partition listing and index it by device path and parent disk"""
+        self._parts_cache = partitions
+        self._part_by_device = {part['device']: part for part in partitions}
+        parts_by_parent = defaultdict(list)
+        for part in partitions:
+            parts_by_parent[_PARTITION_SUFFIX_RE.sub('', part['device'])].append(part)
+        self._parts_by_parent = parts_by_parent
+        
+    def _find_disk(self, device):
+        """Return the listed physical disk with the given device path, or None"""
+        self._get_disks()
+        return self._disk_by_device.get(device)
+        
+    def _find_partition(self, device):
+        """Return the listed partition with the given device path, or None"""
+        self._get_partitions()
+        return self._part_by_device.get(device)
+        
+    def _child_partitions(self, device):
+        """Return the listed partitions of a physical disk"""
+        self._get_partitions()
+        return self._parts_by_parent.get(device, [])
+        
+    def _snapshot_device(self, device_path, is_removable=None):
+        """
+        Query the safety information used by the name and status helpers for one device
+        
+        Args:
+            device_path: The device path to query
+            is_removable: Removable flag from the disk listing, if already known
+            
+        Returns:
+            A dictionary with the device info, its mounted partitions and mountpoints,
+            and system/removable flags
+        """
+        info = self._get_device_info(device_path)
+        mounted_partitions = info.get('mounted_partitions', [])
+        return {
+            'info': info,
+            'mounted_partitions': mounted_partitions,
+            'mountpoints': frozenset(part.get('mountpoint') for part in mounted_partitions),
+            'is_system': info.get('is_system_device', False),
+            'is_removable': info.get('is_removable', False) if is_removable is None else is_removable,
+        }
+        
+    def _build_refresh_snapshot(self, disks):
+        """Collect the safety information for every listed disk once per refresh"""
+        return {
+            disk['device']: self._snapshot_device(disk['device'], disk.get('removable', False))
+            for disk in disks
+        }
+        
+    def _device_snapshot(self, device_path, snapshot=None):
+        """Return the snapshot entry for a device, querying it directly if it is not in the snapshot"""
+        if snapshot is None:
+            snapshot = self._refresh_snapshot
+        entry = snapshot.get(device_path)
+        if entry is None:
+            entry = self._snapshot_device(device_path)
+        return entry
+        
+    def get_friendly_device_name(self, device_path, device_info=None, snapshot=None):
         """
         Generate a user-friendly name for a device based on its properties
         
         Args:
             device_path: The technical device path (e.g., /dev/sda)
             device_info: Optional dictionary with device details
+            snapshot: Optional refresh snapshot to read safety information from
+                      (defaults to the snapshot of the last refresh)
             
         Returns:
             A user-friendly device name
@@ -101,7 +613,7 @@ class DiskForgeMainWindow(QMainWindow):
             
             if device_info.get('removable', False):
                 friendly_name = f"Removable Drive ({size})"
-            elif self.safety_manager.is_system_drive(device_path):
+            elif self._device_snapshot(device_path, snapshot)['is_system']:
                 friendly_name = f"System Drive ({size})"
             else:
                 friendly_name = f"Storage Drive ({size})"
@@ -116,38 +628,70 @@ class DiskForgeMainWindow(QMainWindow):
                 
         return friendly_name
         
-    def get_device_status(self, device_path):
+    def _friendly_name(self, device_path, device_info):
+        """Return get_friendly_device_name() for a listed disk, cached while its properties are unchanged"""
+        key = (
+            device_info.get('model'),
+            device_info.get('size'),
+            device_info.get('removable', False),
+            self._device_snapshot(device_path)['is_system'],
+        )
+        cached = self._friendly_name_cache.get(device_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        name = self.get_friendly_device_name(device_path, device_info)
+        self._friendly_name_cache[device_path] = (key, name)
+        return name
+        
+    def _is_safe_device(self, device_path):
+        """
+        Return SafetyManager.is_safe_device() for display purposes, cached until the next refresh
+        
+        The check guarding the actual format operation always queries the SafetyManager directly.
+        """
+        safe = self._safe_device_cache.get(device_path)
+        if safe is None:
+            safe = self.safety_manager.is_safe_device(device_path)
+            self._safe_device_cache[device_path] = safe
+        return safe
+        
+    def _device_status(self, device_path):
+        """Return get_device_status() for a device, cached until the next refresh"""
+        status = self._status_cache.get(device_path)
+        if status is None:
+            status = self.get_device_status(device_path)
+            self._status_cache[device_path] = status
+        return status
+        
+    def get_device_status(self, device_path, snapshot=None):
         """
         Generate a status description for a device based on its properties
         
         Args:
             device_path: The device path to check
+            snapshot: Optional refresh snapshot to read safety information from
+                      (defaults to the snapshot of the last refresh)
             
         Returns:
             A status string describing the device
         """
         status = []
+        entry = self._device_snapshot(device_path, snapshot)
         
         # Check if it's a system drive
-        if self.safety_manager.is_system_drive(device_path):
+        if entry['is_system']:
             status.append("System Drive")
         
         # Check if it's currently mounted
-        for part in self.safety_manager.get_device_info(device_path).get('mounted_partitions', []):
-            if part.get('mountpoint') == '/':
-                status.append("Root Partition")
-                break
-        else:
+        if '/' in entry['mountpoints']:
+            status.append("Root Partition")
+        elif entry['mounted_partitions']:
             # Check if it contains mounted partitions
-            if self.safety_manager.get_device_info(device_path).get('mounted_partitions'):
-                status.append("Has Mounted Partitions")
+            status.append("Has Mounted Partitions")
         
         # Check if it's removable
-        disks = self.disk_manager.list_physical_disks()
-        for disk in disks:
-            if disk['device'] == device_path and disk.get('removable'):
-                status.append("Removable Device")
-                break
+        if entry['is_removable']:
+            status.append("Removable Device")
                 
         # If we have no status, it's likely just a regular storage device
         if not status:
@@ -158,9 +702,18 @@ class DiskForgeMainWindow(QMainWindow):
     class DeviceItemDelegate(QStyledItemDelegate):
         """Custom delegate for better device display in combo boxes"""
         
-        def __init__(self, parent=None, safety_manager=None):
+        def __init__(self, parent=None, safety_manager=None, is_safe_device=None):
             super().__init__(parent)
             self.safety_manager = safety_manager
+            # Safety check used for the background color, defaults to the SafetyManager's
+            if is_safe_device is None and safety_manager is not None:
+                is_safe_device = safety_manager.is_safe_device
+            self.is_safe_device = is_safe_device
+            # Brushes are reused for every painted item
+            self._danger_brush = QBrush(QColor("#fadbd8"))
+            self._safe_brush = QBrush(QColor("#d4efdf"))
+            # Application style, looked up on the first paint
+            self._style = None
             
         def paint(self, painter, option, index):
             """Custom painting for device entries with safety indicators"""
@@ -177,9 +730,9 @@ class DiskForgeMainWindow(QMainWindow):
             self.initStyleOption(opt, index)
             
             # Check if it's a system drive and adjust background accordingly
-            if self.safety_manager and not self.safety_manager.is_safe_device(device_path):
+            if self.is_safe_device and not self.is_safe_device(device_path):
                 # System drives get a light red background
-                opt.backgroundBrush = QBrush(QColor("#fadbd8"))
+                opt.backgroundBrush = self._danger_brush
             else:
                 # Check if it's a removable device
                 is_removable = False
@@ -187,249 +740,17 @@ class DiskForgeMainWindow(QMainWindow):
                 if isinstance(device_info, dict) and device_info.get('removable', False):
                     # Removable devices get a light green background
                     is_removable = True
-                    opt.backgroundBrush = QBrush(QColor("#d4efdf"))
+                    opt.backgroundBrush = self._safe_brush
             
             # Draw the item with our custom styling
-            QApplication.style().drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter)
+            if self._style is None:
+                self._style = QApplication.style()
+            self._style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter)
     
     def init_ui(self):
         self.setWindowTitle("DiskForge - Disk Management Tool")
         self.setGeometry(100, 100, 1000, 700)
         
-        # Set application style with enhanced colors
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f4f8;
-            }
-            QTabWidget::pane {
-                border: 1px solid #c0c0c0;
-                background-color: white;
-                border-radius: 6px;
-                box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
-            }
-            QTabBar::tab {
-                background-color: #e3e8f0;
-                color: #444444;
-                padding: 12px 24px;
-                margin-right: 3px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: #0078d4;
-                color: white;
-                border-bottom: none;
-                box-shadow: 0 1px 3px rgba(0, 0, 0, 0.2);
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #d0d8e8;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 6px;
-                font-weight: bold;
-                min-height: 32px;
-                box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            }
-            QPushButton:hover {
-                background-color: #0086f0;
-                box-shadow: 0 2px 5px rgba(0, 0, 0, 0.2);
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-                box-shadow: inset 0 1px 3px rgba(0, 0, 0, 0.2);
-            }
-            QPushButton:disabled {
-                background-color: #d0d0d0;
-                color: #707070;
-                box-shadow: none;
-            }
-            
-            /* Danger buttons - for format operations */
-            QPushButton#dangerButton {
-                background-color: #e74c3c;
-                border: 1px solid #c0392b;
-            }
-            QPushButton#dangerButton:hover {
-                background-color: #ff5a4c;
-                border: 1px solid #e74c3c;
-            }
-            QPushButton#dangerButton:pressed {
-                background-color: #c0392b;
-                border: 1px solid #a93226;
-            }
-            QPushButton#dangerButton:disabled {
-                background-color: #f8d0c8;
-                border: 1px solid #e0b8b8;
-                color: #a06060;
-            }
-            
-            /* Success buttons - for safe operations */
-            QPushButton#successButton {
-                background-color: #2ecc71;
-                border: 1px solid #27ae60;
-            }
-            QPushButton#successButton:hover {
-                background-color: #3ee683;
-                border: 1px solid #2ecc71;
-            }
-            QPushButton#successButton:pressed {
-                background-color: #27ae60;
-                border: 1px solid #1e8449;
-            }
-            QPushButton#successButton:disabled {
-                background-color: #c8e8d0;
-                border: 1px solid #b8e0b8;
-                color: #609460;
-            }
-            
-            QTableWidget {
-                gridline-color: #e0e0e8;
-                background-color: white;
-                alternate-background-color: #f2f8ff;
-                border: 1px solid #c0c8d8;
-                border-radius: 6px;
-                margin: 5px;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #e8e8f0;
-            }
-            QTableWidget::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #daeaff;
-                color: #222222;
-                font-weight: bold;
-                padding: 10px 8px;
-                border: none;
-                border-bottom: 2px solid #0078d4;
-                border-right: 1px solid #c0d0e8;
-            }
-            
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #c0c0c0;
-                border-radius: 8px;
-                margin-top: 16px;
-                padding-top: 12px;
-                background-color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px;
-                color: #0078d4;
-            }
-            
-            QLabel {
-                color: #333333;
-            }
-            
-            QLabel#diskInfoLabel {
-                font-weight: bold;
-                color: #0078d4;
-            }
-            
-            QComboBox {
-                border: 1px solid #c0c8d8;
-                border-radius: 5px;
-                padding: 8px;
-                background-color: white;
-                min-height: 30px;
-                selection-background-color: #0078d4;
-                selection-color: white;
-            }
-            
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left: 1px solid #c0c8d8;
-                border-top-right-radius: 5px;
-                border-bottom-right-radius: 5px;
-            }
-            
-            QComboBox::down-arrow {
-                width: 16px;
-                height: 16px;
-                image: url(./assets/dropdown_arrow.png);
-            }
-            
-            QComboBox QAbstractItemView {
-                border: 1px solid #c0c8d8;
-                selection-background-color: #0078d4;
-                outline: 0;
-            }
-            
-            QProgressBar {
-                border: 1px solid #c0c0c0;
-                border-radius: 4px;
-                background-color: #f0f0f0;
-                text-align: center;
-                padding: 1px;
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background-color: #0078d4;
-                width: 1px;
-                margin: 0px;
-            }
-            
-            QCheckBox {
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #c0c0c0;
-                background-color: white;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #0078d4;
-                background-color: #0078d4;
-                border-radius: 3px;
-            }
-            
-            /* System drive warning styles */
-            QLabel#warningLabel {
-                color: #e74c3c;
-                font-weight: bold;
-                background-color: #ffeceb;
-                border: 1px solid #ffd0c8;
-                border-radius: 4px;
-                padding: 8px;
-            }
-            
-            /* Removable drive indicator */
-            QLabel#removableLabel {
-                color: #27ae60;
-                font-weight: bold;
-                background-color: #e8f8f0;
-                border: 1px solid #c8e8d0;
-                border-radius: 4px;
-                padding: 8px;
-            }
-            
-            /* Info label */
-            QLabel#infoLabel {
-                color: #2980b9;
-                background-color: #e8f4fa;
-                border: 1px solid #c8e0f0;
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """)
-        
         # Create central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -442,18 +763,48 @@ class DiskForgeMainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
         
+        # Tabs that are only built the first time they are shown, keyed by tab index
+        self._tab_builders = {}
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        
         # Create tabs
         self.create_disk_info_tab()
-        self.create_format_tab()
-        self.create_usb_creator_tab()
-        self.create_system_info_tab()
-        
-        # Setup custom device view
-        self.setup_custom_device_view()
+        self.add_lazy_tab(self.create_format_tab, "💿 Format")
+        self.add_lazy_tab(self.create_usb_creator_tab, "💾 USB Creator")
+        self.add_lazy_tab(self.create_system_info_tab, "ℹ️ System Info")
         
         # Status bar
         self.statusBar().showMessage("Ready")
         
+    def add_lazy_tab(self, builder, title):
+        """
+        Add a tab whose contents are only built when it is first shown
+        
+        Args:
+            builder: Callable that creates and returns the tab's widget
+            title: The tab title
+        """
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        
+        index = self.tab_widget.addTab(placeholder, title)
+        self._tab_builders[index] = builder
+        
+    def _ensure_tab_built(self, index):
+        """Build the contents of a lazy tab the first time it becomes current"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+            
+        placeholder = self.tab_widget.widget(index)
+        placeholder.layout().addWidget(builder())
+        
+        # Fill in the device combo boxes a format or USB tab may have just created
+        self.setup_custom_device_view()
+        if self._disks_cache is not None:
+            self.update_device_combos(self._get_disks(), self._partition_items)
+        
     def create_disk_info_tab(self):
         """Create the disk information tab with enhanced user-friendly display"""
         disk_tab = QWidget()
@@ -492,17 +843,18 @@ class DiskForgeMainWindow(QMainWindow):
         disks_group = QGroupBox("Physical Storage Devices")
         disks_layout = QVBoxLayout(disks_group)
         
-        self.disks_table = QTableWidget()
-        self.disks_table.setColumnCount(6)  # Added more columns for better identification
-        self.disks_table.setHorizontalHeaderLabels(["Device", "Friendly Name", "Size", "Removable", "Model/Brand", "Status"])
+        self.disk_model = DiskTableModel(self)
+        self.disks_table = QTableView()
+        self.disks_table.setModel(self.disk_model)
         self.disks_table.setAlternatingRowColors(True)
-        self.disks_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.disks_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.disks_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.disks_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.disks_table.horizontalHeader().setStretchLastSection(True)
+        self._set_column_widths(self.disks_table, self.DISKS_COLUMN_WIDTHS)
         disks_layout.addWidget(self.disks_table)
         
         # Connect selection signal to show more details
-        self.disks_table.itemSelectionChanged.connect(self.show_disk_details)
+        self.disks_table.selectionModel().selectionChanged.connect(self.show_disk_details)
         
         # Disk details section
         disk_details_label = QLabel("Device Details:")
@@ -528,6 +880,7 @@ class DiskForgeMainWindow(QMainWindow):
         self.partitions_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.partitions_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.partitions_table.horizontalHeader().setStretchLastSection(True)
+        self._set_column_widths(self.partitions_table, self.PARTITIONS_COLUMN_WIDTHS)
         partitions_layout.addWidget(self.partitions_table)
         
         # Safety information
@@ -547,7 +900,7 @@ class DiskForgeMainWindow(QMainWindow):
         self.tab_widget.addTab(disk_tab, "📀 Disk Information")
         
     def create_format_tab(self):
-        """Create the format disk tab with enhanced UI"""
+        """Create and return the format disk tab with enhanced UI"""
         format_tab = QWidget()
         layout = QVBoxLayout(format_tab)
         
@@ -587,7 +940,7 @@ class DiskForgeMainWindow(QMainWindow):
         
         # Device info display
         self.format_device_info = QLabel("Select a device to see information")
-        self.format_device_info.setStyleSheet("padding: 10px; background-color: #f8f9fa; border-radius: 4px; margin: 5px 0;")
+        self.format_device_info.setObjectName("formatDeviceInfo")
         self.format_device_info.setWordWrap(True)
         format_layout.addWidget(self.format_device_info)
         
@@ -633,14 +986,8 @@ class DiskForgeMainWindow(QMainWindow):
         self.format_btn.setEnabled(False)
         
         # Enable button only when both checkboxes are checked
-        def update_button_state():
-            self.format_btn.setEnabled(
-                self.format_confirm_checkbox1.isChecked() and 
-                self.format_confirm_checkbox2.isChecked()
-            )
-            
-        self.format_confirm_checkbox1.toggled.connect(update_button_state)
-        self.format_confirm_checkbox2.toggled.connect(update_button_state)
+        self.format_confirm_checkbox1.toggled.connect(self._schedule_format_button_update)
+        self.format_confirm_checkbox2.toggled.connect(self._schedule_format_button_update)
         
         format_layout.addWidget(self.format_btn)
         
@@ -651,19 +998,7 @@ class DiskForgeMainWindow(QMainWindow):
         progress_layout = QVBoxLayout(progress_group)
         
         self.format_progress = QProgressBar()
-        self.format_progress.setStyleSheet("""
-            QProgressBar {
-                text-align: center;
-                border: 1px solid #bbb;
-                border-radius: 4px;
-                background-color: #f0f0f0;
-                height: 24px;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 2px;
-            }
-        """)
+        self.format_progress.setObjectName("formatProgress")
         progress_layout.addWidget(self.format_progress)
         
         self.format_status_label = QLabel("Ready")
@@ -674,10 +1009,25 @@ class DiskForgeMainWindow(QMainWindow):
         layout.addWidget(progress_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(format_tab, "💿 Format")
+        return format_tab
+    
+    def _schedule_format_button_update(self):
+        """Coalesce safety checkbox changes into a single format button update"""
+        if self._format_button_update_pending:
+            return
+        self._format_button_update_pending = True
+        QTimer.singleShot(0, self.update_format_button_state)
+        
+    def update_format_button_state(self):
+        """Enable the format button only when both safety checkboxes are checked"""
+        self._format_button_update_pending = False
+        self.format_btn.setEnabled(
+            self.format_confirm_checkbox1.isChecked() and
+            self.format_confirm_checkbox2.isChecked()
+        )
     
     def create_usb_creator_tab(self):
-        """Create the USB creator tab with enhanced user-friendly UI"""
+        """Create and return the USB creator tab with enhanced user-friendly UI"""
         usb_tab = QWidget()
         layout = QVBoxLayout(usb_tab)
         
@@ -738,6 +1088,7 @@ class DiskForgeMainWindow(QMainWindow):
         device_layout.addWidget(QLabel("USB Drive:"))
         self.usb_device_combo = QComboBox()
         self.usb_device_combo.currentIndexChanged.connect(self.update_usb_device_info)
+        self.usb_device_combo.currentIndexChanged.connect(self.usb_inputs_changed)
         device_layout.addWidget(self.usb_device_combo, 1)  # Give it stretch factor
         
         # Refresh USB devices button
@@ -751,7 +1102,7 @@ class DiskForgeMainWindow(QMainWindow):
         # USB device info display
         self.usb_device_info = QLabel("Select a USB drive to see information")
         self.usb_device_info.setWordWrap(True)
-        self.usb_device_info.setStyleSheet("padding: 10px; background-color: #f8f9fa; border-radius: 4px; margin: 5px 0;")
+        self._set_style(self.usb_device_info, self._STYLE_INFO_NEUTRAL)
         usb_layout.addWidget(self.usb_device_info)
         
         # Step 3: Method selection
@@ -805,9 +1156,10 @@ class DiskForgeMainWindow(QMainWindow):
         # Create USB button
         self.create_usb_btn = QPushButton("🚀 Create Bootable USB")
         self.create_usb_btn.setObjectName("successButton")
-        self.create_usb_btn.clicked.connect(self.usb_creator.create_bootable_usb)
+        self.create_usb_btn.clicked.connect(self.create_bootable_usb)
         self.create_usb_btn.setEnabled(False)
-        self.usb_confirm_checkbox.toggled.connect(self.update_usb_button_state)
+        self.usb_confirm_checkbox.toggled.connect(self.usb_inputs_changed)
+        self.usb_inputs_changed.connect(self.update_usb_button_state)
         usb_layout.addWidget(self.create_usb_btn)
         
         layout.addWidget(usb_group)
@@ -818,19 +1170,7 @@ class DiskForgeMainWindow(QMainWindow):
         progress_layout = QVBoxLayout(progress_group)
         
         self.usb_progress = QProgressBar()
-        self.usb_progress.setStyleSheet("""
-            QProgressBar {
-                text-align: center;
-                border: 1px solid #bbb;
-                border-radius: 4px;
-                background-color: #f0f0f0;
-                height: 24px;
-            }
-            QProgressBar::chunk {
-                background-color: #2980b9;
-                border-radius: 2px;
-            }
-        """)
+        self.usb_progress.setObjectName("usbProgress")
         progress_layout.addWidget(self.usb_progress)
         
         self.usb_status_label = QLabel("Ready")
@@ -840,18 +1180,21 @@ class DiskForgeMainWindow(QMainWindow):
         
         # Cancel button
         self.cancel_usb_btn = QPushButton("❌ Cancel")
-        # self.cancel_usb_btn.clicked.connect(self.cancel_usb_creation)
+        self.cancel_usb_btn.clicked.connect(self.cancel_usb_creation)
         self.cancel_usb_btn.setEnabled(False)
         progress_layout.addWidget(self.cancel_usb_btn)
         
         layout.addWidget(progress_group)
         layout.addStretch()
         
-        self.tab_widget.addTab(usb_tab, "💾 USB Creator")
+        return usb_tab
     
     def update_usb_button_state(self):
         """Update USB creation button state with more checks"""
-        has_iso = self.iso_path_label.text() != "No file selected"
+        if self.usb_device_combo is None:
+            return
+            
+        has_iso = self._iso_path is not None
         
         # Get the actual device path from the combo box data
         has_device = False
@@ -860,7 +1203,7 @@ class DiskForgeMainWindow(QMainWindow):
             has_device = bool(self.usb_device_combo.currentData())
             
         confirmed = self.usb_confirm_checkbox.isChecked()
-        not_running = self.operation_thread is None or not self.operation_thread.isRunning()
+        not_running = self.current_operation is None or not self.current_operation.is_running
         
         self.create_usb_btn.setEnabled(has_iso and has_device and confirmed and not_running)
         
@@ -882,37 +1225,42 @@ class DiskForgeMainWindow(QMainWindow):
             self, "Select Linux ISO File", "", "ISO Files (*.iso);;All Files (*)"
         )
         
-        if file_path:
-            self.iso_path_label.setText(file_path)
-            self.update_iso_info(file_path)
-            self.update_usb_button_state()
+        if not file_path:
+            return
+            
+        # Stat the ISO once here; the info panels use the cached size
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+        if file_path == self._iso_path and st is not None and (st.st_size, st.st_mtime) == (self._iso_size, self._iso_mtime):
+            return
+            
+        self._iso_path = file_path
+        self._iso_size = st.st_size if st is not None else None
+        self._iso_mtime = st.st_mtime if st is not None else None
+        self.iso_path_label.setText(file_path)
+        self.update_iso_info(file_path)
+        self.update_usb_device_info()
+        self.usb_inputs_changed.emit()
     
     def update_iso_info(self, iso_path):
-        """Display information about the selected ISO file"""
-        if not iso_path or not os.path.exists(iso_path):
+        """Display information about the selected ISO file, using the size cached by browse_iso_file()"""
+        file_size = self._iso_size
+        if not iso_path or file_size is None:
             self.iso_info_label.setText("Invalid file path")
             return
             
         try:
             # Get basic file info
-            file_size = os.path.getsize(iso_path)
             file_name = os.path.basename(iso_path)
             
             # Convert size to human-readable format
-            if file_size < 1024 * 1024:
-                size_str = f"{file_size / 1024:.1f} KB"
-            elif file_size < 1024 * 1024 * 1024:
-                size_str = f"{file_size / (1024 * 1024):.1f} MB"
-            else:
-                size_str = f"{file_size / (1024 * 1024 * 1024):.2f} GB"
+            size_str = _humanize_bytes(file_size)
                 
             # Try to determine the distro from filename
-            distro = "Linux distribution"
-            for known_distro in ["ubuntu", "debian", "fedora", "mint", "arch", "centos", "manjaro", "kali", 
-                                 "tails", "opensuse", "elementary", "zorin", "puppy", "lubuntu", "xubuntu"]:
-                if known_distro in file_name.lower():
-                    distro = known_distro.capitalize()
-                    break
+            match = _DISTRO_RE.search(file_name)
+            distro = match.group(1).lower().capitalize() if match else "Linux distribution"
                     
             info_text = (
                 f"File: {file_name}\n"
@@ -930,7 +1278,18 @@ class DiskForgeMainWindow(QMainWindow):
             self.iso_info_label.setText(f"Error reading file: {str(e)}")
     
     def update_usb_device_info(self):
+        """Schedule an update of the USB tab device information, coalescing bursts of requests into one"""
+        if self._usb_info_pending:
+            return
+        self._usb_info_pending = True
+        QTimer.singleShot(self.INFO_UPDATE_DELAY, self._do_update_usb_device_info)
+        
+    def _do_update_usb_device_info(self):
         """Update the device information display in the USB tab"""
+        self._usb_info_pending = False
+        if self.usb_device_combo is None:
+            return
+            
         # Get the actual device path from the combo box data
         device_index = self.usb_device_combo.currentIndex()
         if device_index < 0:
@@ -942,16 +1301,8 @@ class DiskForgeMainWindow(QMainWindow):
             self.usb_device_info.setText("No USB drive selected")
             return
             
-        # Get information about the device
-        disks = self.disk_manager.list_physical_disks()
-        
         # Find the device in our list
-        selected_device = None
-        for disk in disks:
-            if disk['device'] == device:
-                selected_device = disk
-                break
-                
+        selected_device = self._find_disk(device)
         if not selected_device:
             self.usb_device_info.setText(f"Device: {device}")
             return
@@ -961,94 +1312,162 @@ class DiskForgeMainWindow(QMainWindow):
         
         # Create the info text
         friendly_name = self.get_friendly_device_name(device, selected_device)
-        info_text = f"<b>Device:</b> {device}"
+        info_text = [f"<b>Device:</b> {device}"]
         
         if friendly_name != device:
-            info_text += f" ({friendly_name})"
+            info_text.append(f" ({friendly_name})")
             
-        info_text += f"<br><b>Size:</b> {selected_device.get('size', 'Unknown')}"
+        info_text.append(f"<br><b>Size:</b> {selected_device.get('size', 'Unknown')}")
         
         if selected_device.get('model'):
-            info_text += f"<br><b>Model:</b> {selected_device['model']}"
+            info_text.append(f"<br><b>Model:</b> {selected_device['model']}")
             
         # Get partitions on this device
-        partitions = self.disk_manager.list_partitions()
-        device_partitions = [p for p in partitions if p['device'].startswith(device)]
+        device_partitions = self._child_partitions(device)
         
         if device_partitions:
-            info_text += "<br><b>Current Partitions:</b>"
+            info_text.append("<br><b>Current Partitions:</b>")
             for part in device_partitions:
                 part_text = f"<br>- {part['device']}"
                 if part.get('type'):
                     part_text += f" ({part['type']})"
                 if part.get('mountpoint'):
                     part_text += f" mounted at {part['mountpoint']}"
-                info_text += part_text
+                info_text.append(part_text)
                 
         # Style based on removable status
         if is_removable:
-            info_text += "<hr><p style='color: #2ecc71; font-weight: bold;'>✅ This is a removable device and suitable for creating a bootable USB.</p>"
-            self.usb_device_info.setStyleSheet(
-                "padding: 10px; background-color: #d4efdf; border: 1px solid #2ecc71; border-radius: 4px; margin: 5px 0;"
-            )
+            info_text.append("<hr><p style='color: #2ecc71; font-weight: bold;'>✅ This is a removable device and suitable for creating a bootable USB.</p>")
+            style = self._STYLE_USB_SAFE
         else:
-            info_text += "<hr><p style='color: #e67e22; font-weight: bold;'>⚠️ This does not appear to be a removable device. Are you sure this is a USB drive?</p>"
-            self.usb_device_info.setStyleSheet(
-                "padding: 10px; background-color: #fef9e7; border: 1px solid #e67e22; border-radius: 4px; margin: 5px 0;"
-            )
+            info_text.append("<hr><p style='color: #e67e22; font-weight: bold;'>⚠️ This does not appear to be a removable device. Are you sure this is a USB drive?</p>")
+            style = self._STYLE_USB_WARN
             
         # Check if the device is large enough
-        iso_path = self.iso_path_label.text()
-        if os.path.exists(iso_path):
+        file_size = self._iso_size
+        if file_size is not None:
             try:
-                file_size = os.path.getsize(iso_path)
-                # Parse device size string (like "16GB") to get value in bytes
-                device_size_str = selected_device.get('size', '0')
-                device_size_value = float(''.join(filter(str.isdigit, device_size_str)))
-                device_size_unit = ''.join(filter(str.isalpha, device_size_str)).upper()
+                # Parse device size string (like "16GB", "14.9G" or "7.5 GiB") to get value in bytes
+                match = _SIZE_RE.match(str(selected_device.get('size', '')))
+                device_size_bytes = float(match.group(1)) * _SIZE_MULT[match.group(2).upper()] if match else 0
                 
-                device_size_bytes = device_size_value
-                if 'KB' in device_size_unit:
-                    device_size_bytes *= 1024
-                elif 'MB' in device_size_unit:
-                    device_size_bytes *= 1024 * 1024
-                elif 'GB' in device_size_unit:
-                    device_size_bytes *= 1024 * 1024 * 1024
-                elif 'TB' in device_size_unit:
-                    device_size_bytes *= 1024 * 1024 * 1024 * 1024
-                
-                if file_size > device_size_bytes:
-                    info_text += "<p style='color: #e74c3c; font-weight: bold;'>⚠️ Warning: ISO file is larger than the USB drive capacity!</p>"
-                    self.usb_device_info.setStyleSheet(
-                        "padding: 10px; background-color: #fadbd8; border: 2px solid #e74c3c; border-radius: 4px; margin: 5px 0;"
-                    )
+                if device_size_bytes and file_size > device_size_bytes:
+                    info_text.append("<p style='color: #e74c3c; font-weight: bold;'>⚠️ Warning: ISO file is larger than the USB drive capacity!</p>")
+                    style = self._STYLE_USB_DANGER
             except Exception:
                 # If we can't parse the size, just skip this check
                 pass
             
-        self.usb_device_info.setText(info_text)
+        self._set_style(self.usb_device_info, style)
+        self.usb_device_info.setText("".join(info_text))
         
     def refresh_disk_info(self):
-        """Refresh disk and partition information with enhanced details"""
+        """Schedule a refresh of disk information, coalescing bursts of requests into one"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+        
+    def _do_refresh(self):
+        """Run the scheduled refresh"""
+        self._refresh_pending = False
+        self._refresh_now()
+        
+    def _refresh_now(self):
+        """Enumerate disks and partitions on the thread pool, see _apply_refresh_results()"""
+        if self._refresh_worker is not None:
+            # A refresh is already running - run one more once it has finished
+            self._refresh_again = True
+            return
+            
+        self._refresh_worker = DiskRefreshWorker(self.disk_manager, self.safety_manager)
+        self._refresh_worker.signals.results_ready.connect(self._apply_refresh_results)
+        self._refresh_worker.signals.refresh_failed.connect(self._refresh_failed)
+        QThreadPool.globalInstance().start(self._refresh_worker)
+        
+    def _apply_refresh_results(self, results):
+        """Refresh disk and partition views with the results of a DiskRefreshWorker"""
         try:
+            disks = results['disks']
+            partitions = results['partitions']
+            self._dev_info_cache = dict(results['device_info'])
+            self._safe_device_cache = dict(results['safe_devices'])
+            self._status_cache = {}
+            self._partition_items = results['partition_items']
+            
+            # Forget the friendly names of disks that have disappeared
+            devices = {disk['device'] for disk in disks}
+            for device in set(self._friendly_name_cache) - devices:
+                del self._friendly_name_cache[device]
+                
+            self._set_disks(disks)
+            self._set_partitions(partitions)
+            
             # Refresh physical disks
-            disks = self.disk_manager.list_physical_disks()
+            self._refresh_snapshot = self._build_refresh_snapshot(disks)
             self.update_disks_table(disks)
             
             # Refresh partitions
-            partitions = self.disk_manager.list_partitions()
             self.update_partitions_table(partitions)
             
             # Update device combo boxes
-            self.update_device_combos(disks)
+            self.update_device_combos(disks, self._partition_items)
             
-            self.statusBar().showMessage(f"Last updated: {time.strftime('%H:%M:%S')}")
+            self.statusBar().showMessage(f"Last updated: {QTime.currentTime().toString('HH:mm:ss')}")
             
         except Exception as e:
             self.statusBar().showMessage(f"Error refreshing disk info: {str(e)}")
+        finally:
+            self._refresh_worker_done()
+            
+    def _refresh_failed(self, message):
+        """Report a failed background refresh"""
+        self.statusBar().showMessage(f"Error refreshing disk info: {message}")
+        self._refresh_worker_done()
+        
+    def _refresh_worker_done(self):
+        """Release the finished refresh worker and run a refresh requested in the meantime"""
+        self._refresh_worker = None
+        if self._refresh_again:
+            self._refresh_again = False
+            self.refresh_disk_info()
+    
+    def setup_device_monitor(self):
+        """Watch udev for block device events so disk info is refreshed only when it changes"""
+        if pyudev is None:
+            return
+            
+        try:
+            context = pyudev.Context()
+            monitor = pyudev.Monitor.from_netlink(context)
+            monitor.filter_by(subsystem='block')
+            
+            self.devices_changed.connect(self.on_devices_changed)
+            self.device_observer = pyudev.MonitorObserver(
+                monitor, callback=self._handle_udev_event, name='diskforge-udev-monitor'
+            )
+            self.device_observer.start()
+        except Exception as e:
+            print(f"Error starting device monitor: {str(e)}")
+            self.device_observer = None
+    
+    def _handle_udev_event(self, device):
+        """Forward relevant udev events to the GUI thread (runs on the monitor thread)"""
+        if device.action in ('add', 'remove', 'change'):
+            self.devices_changed.emit()
+    
+    def on_devices_changed(self):
+        """Refresh disk information after a hotplug event if auto-refresh is enabled"""
+        if self.auto_refresh_checkbox.isChecked():
+            self.refresh_disk_info()
     
     def setup_refresh_timer(self):
-        """Set up a timer for automatic refreshing of disk information"""
+        """Set up polling of disk information, unless udev events drive the refresh"""
+        if self.device_observer:
+            # Hotplug events trigger the refresh, no polling needed
+            self.auto_refresh_checkbox.setText("Auto-refresh when devices change")
+            return
+            
         self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.refresh_disk_info)
         # Default interval of 5 seconds as mentioned in the UI label
@@ -1061,399 +1480,438 @@ class DiskForgeMainWindow(QMainWindow):
     def toggle_auto_refresh(self, enabled):
         """Toggle automatic refreshing of disk information based on checkbox state"""
         if enabled:
-            # Start the timer if it exists
-            if self.refresh_timer:
+            if self.device_observer:
+                # on_devices_changed() checks the checkbox, so there is nothing to start
+                self.statusBar().showMessage("Auto-refresh enabled (on device changes)")
+            elif self.refresh_timer:
                 self.refresh_timer.start()
                 self.statusBar().showMessage("Auto-refresh enabled (every 5 seconds)")
         else:
             # Stop the timer if it exists
             if self.refresh_timer:
                 self.refresh_timer.stop()
-                self.statusBar().showMessage("Auto-refresh disabled")
+            self.statusBar().showMessage("Auto-refresh disabled")
     
+    def _set_style(self, widget, style):
+        """Set a widget's stylesheet, skipping the re-parse and re-polish if it is unchanged"""
+        if widget.styleSheet() != style:
+            widget.setStyleSheet(style)
+            
+    def _set_state(self, widget, state):
+        """Set the "state" property main.qss selects on, re-polishing the widget only if it changed"""
+        if widget.property("state") != state:
+            widget.setProperty("state", state)
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+            
+    def _set_column_widths(self, table, widths):
+        """Give a table fixed, user-resizable column widths (the last column stretches)"""
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for col, width in enumerate(widths):
+            table.setColumnWidth(col, width)
+            
+    @contextmanager
+    def _batch_table_update(self, table):
+        """Populate a table in one batch without per-cell repaints, re-sorting or signals"""
+        was_sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        blocker = QSignalBlocker(table)
+        try:
+            yield table
+        finally:
+            blocker.unblock()
+            table.setSortingEnabled(was_sorting)
+            table.setUpdatesEnabled(True)
+            
+    def _table_item(self, table, row, col, text):
+        """Return the item for a table cell with the given text, reusing the existing item if any"""
+        item = table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem(text)
+            table.setItem(row, col, item)
+        else:
+            item.setText(text)
+            # Drop any styling left over from the previous contents of this cell
+            item.setData(Qt.ItemDataRole.ForegroundRole, None)
+            item.setData(Qt.ItemDataRole.BackgroundRole, None)
+            item.setData(Qt.ItemDataRole.FontRole, None)
+        return item
+        
     def update_disks_table(self, disks):
         """Update the physical disks table with enhanced information"""
-        self.disks_table.setRowCount(len(disks))
-        
-        for row, disk in enumerate(disks):
-            # Device path
-            device_item = QTableWidgetItem(disk['device'])
-            self.disks_table.setItem(row, 0, device_item)
-            
-            # Friendly name
-            friendly_name = self.get_friendly_device_name(disk['device'], disk)
-            self.disks_table.setItem(row, 1, QTableWidgetItem(friendly_name))
-            
-            # Size
-            self.disks_table.setItem(row, 2, QTableWidgetItem(disk['size']))
-            
-            # Removable status with colorization
-            is_removable = disk.get('removable', False)
-            removable_item = QTableWidgetItem("Yes" if is_removable else "No")
-            removable_item.setForeground(QColor("#2ecc71" if is_removable else "#7f8c8d"))
-            if is_removable:
-                removable_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            self.disks_table.setItem(row, 3, removable_item)
-            
-            # Model/Brand with better formatting
-            model = disk.get('model', 'Unknown')
-            if model and model.strip() and model != "Unknown":
-                model_item = QTableWidgetItem(model)
-            else:
-                model_item = QTableWidgetItem("Not available")
-                model_item.setForeground(QColor("#7f8c8d"))
-            self.disks_table.setItem(row, 4, model_item)
-            
-            # Status (system drive, mounted, etc.)
-            status = self.get_device_status(disk['device'])
-            status_item = QTableWidgetItem(status)
-            
-            # Color the status based on type
-            if "System" in status:
-                status_item.setForeground(QColor("#e74c3c"))  # Red for system drives
-                status_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            elif "Removable" in status:
-                status_item.setForeground(QColor("#2ecc71"))  # Green for removable
-            
-            self.disks_table.setItem(row, 5, status_item)
-            
-            # If this is a system device, highlight the entire row for safety
-            if not self.safety_manager.is_safe_device(disk['device']):
-                for col in range(self.disks_table.columnCount()):
-                    if col != 5:  # Skip the status column which already has custom color
-                        self.disks_table.item(row, col).setBackground(QColor("#fadbd8"))  # Light red
+        # Everything a row shows, so unchanged rows (usually all of them) can be skipped
+        rows = []
+        for disk in disks:
+            device = disk['device']
+            rows.append((
+                device,
+                self._friendly_name(device, disk),
+                disk['size'],
+                disk.get('removable', False),
+                disk.get('model', 'Unknown'),
+                self._device_status(device),
+                self._is_safe_device(device),
+            ))
+            
+        if rows == self._disk_row_sigs:
+            return
+        self.disk_model.set_rows(rows)
+        self._disk_row_sigs = rows
         
-        self.disks_table.resizeColumnsToContents()
+        # A model reset drops the selection without a selectionChanged signal, and the
+        # selected disk's details may have changed, so refresh the details pane as well
+        self.show_disk_details()
         
     def show_disk_details(self):
         """Show detailed information about the selected disk"""
-        selected_items = self.disks_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.disks_table.selectionModel().selectedRows()
+        if not selected_rows:
             self.disk_details_text.setText("Select a device to see details.")
             return
             
-        # Get the device path from the first column
-        row = self.disks_table.row(selected_items[0])
-        device_path = self.disks_table.item(row, 0).text()
+        # Get the device path of the selected row
+        device_path = self.disk_model.device_at(selected_rows[0].row())
         
-        # Get all disks to find the selected one
-        disks = self.disk_manager.list_physical_disks()
-        selected_disk = None
-        for disk in disks:
-            if disk['device'] == device_path:
-                selected_disk = disk
-                break
-                
+        # Find the selected disk
+        selected_disk = self._find_disk(device_path)
         if not selected_disk:
             self.disk_details_text.setText("No detailed information available")
             return
             
         # Get safety information
-        safety_info = self.safety_manager.get_device_info(device_path)
+        safety_info = self._get_device_info(device_path)
         
         # Format details nicely
-        details = f"<b>Device:</b> {device_path}<br>"
+        details = [f"<b>Device:</b> {device_path}<br>"]
         
         if selected_disk.get('model'):
-            details += f"<b>Model:</b> {selected_disk['model']}<br>"
+            details.append(f"<b>Model:</b> {selected_disk['model']}<br>")
             
-        details += f"<b>Size:</b> {selected_disk['size']}<br>"
-        details += f"<b>Removable:</b> {'Yes' if selected_disk.get('removable', False) else 'No'}<br>"
+        details.append(f"<b>Size:</b> {selected_disk['size']}<br>")
+        details.append(f"<b>Removable:</b> {'Yes' if selected_disk.get('removable', False) else 'No'}<br>")
         
         # Add warning for system devices
-        if not self.safety_manager.is_safe_device(device_path):
-            details += f"<p style='color: #e74c3c; font-weight: bold;'>⚠️ WARNING: This appears to be a system drive!</p>"
+        if not self._is_safe_device(device_path):
+            details.append("<p style='color: #e74c3c; font-weight: bold;'>⚠️ WARNING: This appears to be a system drive!</p>")
             
         # Show mounted partitions
         if safety_info.get('mounted_partitions'):
-            details += "<b>Mounted Partitions:</b><br>"
+            details.append("<b>Mounted Partitions:</b><br>")
             for part in safety_info['mounted_partitions']:
-                details += f"- {part['device']} → {part['mountpoint']} ({part['fstype']})<br>"
+                details.append(f"- {part['device']} → {part['mountpoint']} ({part['fstype']})<br>")
         
-        self.disk_details_text.setHtml(details)
+        self.disk_details_text.setHtml("".join(details))
         
     def update_partitions_table(self, partitions):
         """Update the partitions table with enhanced user-friendly information"""
-        self.partitions_table.setRowCount(len(partitions))
-        
-        for row, part in enumerate(partitions):
-            # Device path
-            device_item = QTableWidgetItem(part['device'])
-            self.partitions_table.setItem(row, 0, device_item)
-            
-            # Label/Name (mostly for Windows drives, but can have labels on Linux/Mac too)
-            label = part.get('label', '')
-            if not label:
-                # Try to create a meaningful label
-                mountpoint = part.get('mountpoint')
-                if mountpoint:
-                    if mountpoint == '/':
-                        label = "System Root"
-                    elif mountpoint == '/boot':
-                        label = "Boot Partition"
-                    elif mountpoint == '/home':
-                        label = "User Files"
-                    elif mountpoint.startswith('/media') or mountpoint.startswith('/mnt'):
-                        label = "External Storage"
-                    else:
-                        # Use the last part of the path
-                        label = os.path.basename(mountpoint)
-                        
-                # If that didn't work, use the device name
+        table = self.partitions_table
+        
+        # Rows are derived from the partition properties only, so unchanged rows can be skipped
+        rows = [
+            (part['device'], part.get('label'), part['size'], part.get('type'),
+             part.get('mountpoint'), part.get('percent_used'))
+            for part in partitions
+        ]
+        previous_rows = self._partition_row_sigs
+        if rows == previous_rows:
+            return
+        
+        with self._batch_table_update(table):
+            if table.rowCount() != len(partitions):
+                table.setRowCount(len(partitions))
+            
+            for row, part in enumerate(partitions):
+                if row < len(previous_rows) and previous_rows[row] == rows[row]:
+                    continue
+                    
+                # Device path
+                self._table_item(table, row, 0, part['device'])
+                
+                # Label/Name (mostly for Windows drives, but can have labels on Linux/Mac too)
+                label = part.get('label', '')
                 if not label:
-                    label = os.path.basename(part['device'])
-            
-            self.partitions_table.setItem(row, 1, QTableWidgetItem(label))
-            
-            # Size
-            self.partitions_table.setItem(row, 2, QTableWidgetItem(part['size']))
-            
-            # Format filesystem type in a more user-friendly way
-            fs_type = part.get('type', 'Unknown')
-            if fs_type is None:
-                fs_type = "Unknown"
-            
-            # Make filesystem types more user-friendly
-            friendly_fs = fs_type
-            if fs_type.lower() == 'ext4' or fs_type.lower() == 'ext3':
-                friendly_fs = "Linux Filesystem"
-            elif fs_type.lower() == 'ntfs':
-                friendly_fs = "Windows Filesystem"
-            elif fs_type.lower() == 'fat32' or fs_type.lower() == 'vfat':
-                friendly_fs = "FAT32 (Compatible)"
-            elif fs_type.lower() == 'exfat':
-                friendly_fs = "exFAT (External)"
-            elif fs_type.lower() == 'apfs':
-                friendly_fs = "Apple Filesystem"
-            elif fs_type.lower() == 'hfs+':
-                friendly_fs = "Mac OS Extended"
+                    # Try to create a meaningful label
+                    mountpoint = part.get('mountpoint')
+                    if mountpoint:
+                        if mountpoint == '/':
+                            label = "System Root"
+                        elif mountpoint == '/boot':
+                            label = "Boot Partition"
+                        elif mountpoint == '/home':
+                            label = "User Files"
+                        elif mountpoint.startswith('/media') or mountpoint.startswith('/mnt'):
+                            label = "External Storage"
+                        else:
+                            # Use the last part of the path
+                            label = os.path.basename(mountpoint)
+                            
+                    # If that didn't work, use the device name
+                    if not label:
+                        label = os.path.basename(part['device'])
                 
-            self.partitions_table.setItem(row, 3, QTableWidgetItem(friendly_fs))
-            
-            # Format mountpoint
-            mountpoint = part.get('mountpoint', 'Not mounted')
-            if mountpoint is None:
-                mountpoint = "Not mounted"
+                self._table_item(table, row, 1, label)
                 
-            # Make mountpoints more user-friendly
-            friendly_mount = mountpoint
-            if mountpoint == '/':
-                friendly_mount = "System Root Directory"
-            elif mountpoint == '/boot':
-                friendly_mount = "Boot Files"
-            elif mountpoint == '/home':
-                friendly_mount = "User Home Directories"
-            elif mountpoint.startswith('/media') or mountpoint.startswith('/mnt'):
-                # Extract the last part which is often the volume name
-                mount_name = os.path.basename(mountpoint)
-                if mount_name:
-                    friendly_mount = f"Mounted as: {mount_name}"
-                else:
-                    friendly_mount = "External Media"
-            
-            self.partitions_table.setItem(row, 4, QTableWidgetItem(friendly_mount))
-            
-            # Usage with progress indication
-            usage = "Unknown"
-            if part.get('percent_used') is not None:
-                percent_used = part['percent_used']
-                usage = f"{percent_used:.1f}% used"
+                # Size
+                self._table_item(table, row, 2, part['size'])
                 
-                # Add visual indicator of space usage
-                if percent_used > 90:
-                    usage = f"⚠️ {usage} (Almost Full)"
-                elif percent_used > 75:
-                    usage = f"⚠️ {usage} (Getting Full)"
+                # Format filesystem type in a more user-friendly way
+                fs_type = part.get('type', 'Unknown')
+                if fs_type is None:
+                    fs_type = "Unknown"
                 
-                usage_item = QTableWidgetItem(usage)
+                # Make filesystem types more user-friendly
+                friendly_fs = FS_FRIENDLY.get(fs_type.lower(), fs_type)
+                self._table_item(table, row, 3, friendly_fs)
                 
-                # Color code based on usage
-                if percent_used > 90:
-                    usage_item.setForeground(QColor("#e74c3c"))  # Red for almost full
-                elif percent_used > 75:
-                    usage_item.setForeground(QColor("#f39c12"))  # Orange for getting full
-                elif percent_used < 25:
-                    usage_item.setForeground(QColor("#2ecc71"))  # Green for lots of space
+                # Format mountpoint
+                mountpoint = part.get('mountpoint', 'Not mounted')
+                if mountpoint is None:
+                    mountpoint = "Not mounted"
+                    
+                # Make mountpoints more user-friendly
+                friendly_mount = MOUNT_FRIENDLY.get(mountpoint, mountpoint)
+                if mountpoint.startswith(('/media', '/mnt')):
+                    # Extract the last part which is often the volume name
+                    mount_name = os.path.basename(mountpoint)
+                    if mount_name:
+                        friendly_mount = f"Mounted as: {mount_name}"
+                    else:
+                        friendly_mount = "External Media"
                 
-                self.partitions_table.setItem(row, 5, usage_item)
-            else:
-                self.partitions_table.setItem(row, 5, QTableWidgetItem("Unknown"))
-            
-            # Highlight system partitions for safety
-            if mountpoint in ['/', '/boot', '/efi', '/bin', '/usr', '/etc', 'C:\\', 'C:\\Windows']:
-                for col in range(self.partitions_table.columnCount()):
-                    self.partitions_table.item(row, col).setBackground(QColor("#fadbd8"))  # Light red
+                self._table_item(table, row, 4, friendly_mount)
+                
+                # Usage with progress indication
+                usage = "Unknown"
+                if part.get('percent_used') is not None:
+                    percent_used = part['percent_used']
+                    usage = f"{percent_used:.1f}% used"
+                    
+                    # Add visual indicator of space usage
+                    if percent_used > 90:
+                        usage = f"⚠️ {usage} (Almost Full)"
+                    elif percent_used > 75:
+                        usage = f"⚠️ {usage} (Getting Full)"
+                    
+                    usage_item = self._table_item(table, row, 5, usage)
+                    
+                    # Color code based on usage
+                    if percent_used > 90:
+                        usage_item.setForeground(_COLOR_RED)  # Red for almost full
+                    elif percent_used > 75:
+                        usage_item.setForeground(_COLOR_ORANGE)  # Orange for getting full
+                    elif percent_used < 25:
+                        usage_item.setForeground(_COLOR_GREEN)  # Green for lots of space
+                else:
+                    self._table_item(table, row, 5, "Unknown")
                 
-        self.partitions_table.resizeColumnsToContents()
+                # Highlight system partitions for safety
+                if mountpoint in _SYSTEM_MOUNTS:
+                    for col in range(table.columnCount()):
+                        table.item(row, col).setBackground(_COLOR_LIGHT_RED)  # Light red
+            
+        self._partition_row_sigs = rows
         
     def update_format_device_info(self):
+        """Schedule an update of the format tab device information, coalescing bursts of requests into one"""
+        if self._format_info_pending:
+            return
+        self._format_info_pending = True
+        QTimer.singleShot(self.INFO_UPDATE_DELAY, self._do_update_format_device_info)
+        
+    def _do_update_format_device_info(self):
         """Update the device information display in the format tab with enhanced user-friendly details"""
+        self._format_info_pending = False
+        if self.format_device_combo is None:
+            return
+        # Shown contents are unknown until a device's details are built below
+        last_key, self._last_info_key = self._last_info_key, None
+            
         # Get the actual device path from the combo box data
         device_index = self.format_device_combo.currentIndex()
         if device_index < 0:
             self.format_device_info.setText("Please select a device")
-            self.format_device_info.setStyleSheet("padding: 10px; background-color: #f8f9fa; border-radius: 4px; margin: 5px 0;")
+            self._set_state(self.format_device_info, None)
             return
             
         device = self.format_device_combo.itemData(device_index)
         if not device:
             self.format_device_info.setText("Please select a device")
-            self.format_device_info.setStyleSheet("padding: 10px; background-color: #f8f9fa; border-radius: 4px; margin: 5px 0;")
+            self._set_state(self.format_device_info, None)
             return
             
-        # Get information about the device
-        disks = self.disk_manager.list_physical_disks()
-        partitions = self.disk_manager.list_partitions()
-        
         # Find the device in our list
-        selected_device = None
-        
-        for disk in disks:
-            if disk['device'] == device:
-                selected_device = disk
-                break
-                
-        if not selected_device:
-            for part in partitions:
-                if part['device'] == device:
-                    selected_device = part
-                    break
+        selected_device = self._find_disk(device) or self._find_partition(device)
         
         if not selected_device:
             self.format_device_info.setText("No information available for this device.")
-            self.format_device_info.setStyleSheet("padding: 10px; background-color: #f8f9fa; border-radius: 4px; margin: 5px 0;")
+            self._set_state(self.format_device_info, None)
             return
             
         # Check if this is a system drive
-        is_system_drive = not self.safety_manager.is_safe_device(device)
+        is_system_drive = not self._is_safe_device(device)
         is_removable = selected_device.get('removable', False)
+        status = self._device_status(device)
+        device_partitions = self._child_partitions(device)
         
         # Get a friendly name for the device
         friendly_name = self.get_friendly_device_name(device, selected_device)
         
+        # Keep the panel as it is if nothing it shows has changed since the last update
+        key = (
+            device, friendly_name, is_system_drive, is_removable, status,
+            selected_device.get('model'), selected_device.get('size'),
+            tuple((part['device'], part.get('type'), part['size'], part.get('mountpoint'))
+                  for part in device_partitions),
+        )
+        self._last_info_key = key
+        if key == last_key:
+            return
+            
         # Format information with HTML for better formatting
-        info = f"<div style='line-height: 1.5;'>"
-        
-        # Show user-friendly name prominently
-        info += f"<h3 style='margin: 0 0 10px 0;'>{friendly_name}</h3>"
-        
-        # Technical details in a table format
-        info += "<table style='width: 100%; border-collapse: collapse; margin-bottom: 10px;'>"
-        info += f"<tr><td style='padding: 4px; font-weight: bold; width: 35%;'>Device Path:</td><td>{device}</td></tr>"
+        info = []
+        
+        # Show user-friendly name prominently, then technical details in a table format
+        info.extend((
+            "<div style='line-height: 1.5;'>",
+            f"<h3 style='margin: 0 0 10px 0;'>{friendly_name}</h3>",
+            "<table style='width: 100%; border-collapse: collapse; margin-bottom: 10px;'>",
+            f"<tr><td style='padding: 4px; font-weight: bold; width: 35%;'>Device Path:</td><td>{device}</td></tr>",
+        ))
         if selected_device.get('model'):
-            info += f"<tr><td style='padding: 4px; font-weight: bold;'>Model:</td><td>{selected_device['model']}</td></tr>"
-        info += f"<tr><td style='padding: 4px; font-weight: bold;'>Size:</td><td>{selected_device['size']}</td></tr>"
-        info += f"<tr><td style='padding: 4px; font-weight: bold;'>Removable Device:</td><td>{'Yes' if is_removable else 'No'}</td></tr>"
-        info += f"<tr><td style='padding: 4px; font-weight: bold;'>Status:</td><td>{self.get_device_status(device)}</td></tr>"
-        info += "</table>"
+            info.append(f"<tr><td style='padding: 4px; font-weight: bold;'>Model:</td><td>{selected_device['model']}</td></tr>")
+        info.extend((
+            f"<tr><td style='padding: 4px; font-weight: bold;'>Size:</td><td>{selected_device['size']}</td></tr>",
+            f"<tr><td style='padding: 4px; font-weight: bold;'>Removable Device:</td><td>{'Yes' if is_removable else 'No'}</td></tr>",
+            f"<tr><td style='padding: 4px; font-weight: bold;'>Status:</td><td>{status}</td></tr>",
+            "</table>",
+        ))
         
         # Add partition information in a more readable format
-        device_partitions = [p for p in partitions if p['device'].startswith(device)]
         if device_partitions:
-            info += f"<h4 style='margin: 5px 0;'>Current Partitions: {len(device_partitions)}</h4>"
-            info += "<ul style='margin: 5px 0 10px 0; padding-left: 20px;'>"
+            info.extend((
+                f"<h4 style='margin: 5px 0;'>Current Partitions: {len(device_partitions)}</h4>",
+                "<ul style='margin: 5px 0 10px 0; padding-left: 20px;'>",
+            ))
             for part in device_partitions:
                 part_info = f"{part['device']} ({part.get('type', 'Unknown')}) {part['size']}"
                 if part.get('mountpoint'):
                     part_info += f" mounted at <b>{part['mountpoint']}</b>"
-                info += f"<li>{part_info}</li>"
-            info += "</ul>"
+                info.append(f"<li>{part_info}</li>")
+            info.append("</ul>")
         
         # Add warning for system drives with more prominent styling
         if is_system_drive:
-            info += "<div style='background-color: #ffebeb; border: 2px solid #e74c3c; border-radius: 4px; padding: 10px; margin-top: 10px;'>"
-            info += "<span style='font-weight: bold; color: #e74c3c; font-size: 16px;'>⚠️ WARNING: System Drive Detected!</span><br>"
-            info += "This appears to be a system drive containing important operating system files. "
-            info += "Formatting this drive may damage your operating system and make your computer unbootable."
-            info += "</div>"
-            self.format_device_info.setStyleSheet("padding: 10px; background-color: #fff8f8; border: 1px solid #e0c0c0; border-radius: 4px; margin: 5px 0;")
+            info.append(_FORMAT_SYSTEM_WARNING_HTML)
+            self._set_state(self.format_device_info, "danger")
         elif is_removable:
-            info += "<div style='background-color: #ebfff0; border: 2px solid #2ecc71; border-radius: 4px; padding: 10px; margin-top: 10px;'>"
-            info += "<span style='font-weight: bold; color: #27ae60; font-size: 16px;'>✅ Removable Device</span><br>"
-            info += "This is a removable device that should be safe to format. Still, make sure you've backed up any important data."
-            info += "</div>"
-            self.format_device_info.setStyleSheet("padding: 10px; background-color: #f8fff8; border: 1px solid #c0e0c0; border-radius: 4px; margin: 5px 0;")
+            info.append(_FORMAT_REMOVABLE_NOTICE_HTML)
+            self._set_state(self.format_device_info, "safe")
         else:
-            info += "<div style='background-color: #fff8eb; border: 2px solid #f39c12; border-radius: 4px; padding: 10px; margin-top: 10px;'>"
-            info += "<span style='font-weight: bold; color: #e67e22; font-size: 16px;'>⚠️ Storage Device</span><br>"
-            info += "This is a non-removable storage device. Please verify that it doesn't contain important data before formatting."
-            info += "</div>"
-            self.format_device_info.setStyleSheet("padding: 10px; background-color: #fffcf5; border: 1px solid #e0d8c0; border-radius: 4px; margin: 5px 0;")
+            info.append(_FORMAT_STORAGE_NOTICE_HTML)
+            self._set_state(self.format_device_info, "warn")
             
-        info += "</div>"
-        self.format_device_info.setHtml(info)
+        info.append("</div>")
+        self.format_device_info.setText("".join(info))
         
-    def update_device_combos(self, disks):
+    def update_device_combos(self, disks, partition_items=None):
         """Update device combo boxes with more descriptive names"""
+        # Only the combo boxes of tabs that have been built
+        combos = [combo for combo in (self.format_device_combo, self.usb_device_combo) if combo is not None]
+        if not combos:
+            return
+            
         # Save current selections
-        current_format_device = self.format_device_combo.currentText()
-        current_usb_device = self.usb_device_combo.currentText()
+        current_format_device = self.format_device_combo.currentData() if self.format_device_combo is not None else None
+        current_usb_device = self.usb_device_combo.currentData() if self.usb_device_combo is not None else None
+        
+        # Suppress per-item signals and repaints while repopulating
+        for combo in combos:
+            combo.blockSignals(True)
+            combo.setUpdatesEnabled(False)
+        try:
+            self._populate_device_combos(disks, partition_items, current_format_device, current_usb_device)
+        finally:
+            for combo in combos:
+                combo.setUpdatesEnabled(True)
+                combo.blockSignals(False)
+                
+        # Signals were blocked, so refresh the dependent views explicitly
+        self.update_format_device_info()
+        self.update_usb_device_info()
+        self.usb_inputs_changed.emit()
         
-        # Clear and repopulate
-        self.format_device_combo.clear()
-        self.usb_device_combo.clear()
+    def _populate_device_combos(self, disks, partition_items, current_format_device, current_usb_device):
+        """Refill the device combo boxes, restoring previous selections"""
+        format_items = []
+        usb_items = []
+        friendly_name_of = self._friendly_name
+        is_safe = self._is_safe_device
         
         # Add all devices to format combo with descriptive names
         for disk in disks:
-            friendly_name = self.get_friendly_device_name(disk['device'], disk)
-            display_text = f"{disk['device']} - {friendly_name} ({disk['size']})"
+            device = disk['device']
+            removable = disk.get('removable', False)
+            display_text = f"{device} - {friendly_name_of(device, disk)} ({disk['size']})"
             
             # Add warning indicator for system drives
-            if not self.safety_manager.is_safe_device(disk['device']):
+            if not is_safe(device):
                 display_text += " ⚠️ SYSTEM"
                 
             # Add removable indicator
-            if disk.get('removable', False):
+            if removable:
                 display_text += " ✓ REMOVABLE"
                 
-            self.format_device_combo.addItem(display_text, disk['device'])
+            format_items.append((display_text, device))
             
             # Only add removable devices to USB combo
-            if disk.get('removable', False):
-                self.usb_device_combo.addItem(display_text, disk['device'])
+            if removable:
+                usb_items.append((display_text, device))
                 
         # Add partitions to format combo
-        partitions = self.disk_manager.list_partitions()
-        for part in partitions:
-            # Create descriptive text
-            desc = f"{part['device']} - {part['size']}"
+        if partition_items is None:
+            partition_items = _partition_combo_items(self._get_partitions())
+        format_items.extend(partition_items)
+        
+        if self.format_device_combo is not None:
+            self._set_combo_items(self.format_device_combo, format_items, current_format_device)
+        if self.usb_device_combo is not None:
+            self._set_combo_items(self.usb_device_combo, usb_items, current_usb_device)
+        
+    def _set_combo_items(self, combo, items, current_device):
+        """Replace the (text, device) items of a combo box unless they are unchanged"""
+        current_items = [(combo.itemText(i), combo.itemData(i)) for i in range(combo.count())]
+        if items == current_items:
+            # Nothing changed - keep the list and the user's pending selection as they are
+            return
             
-            # Add filesystem type if available
-            if part.get('type'):
-                desc += f" ({part['type']})"
-                
-            # Add mountpoint if available
-            if part.get('mountpoint'):
-                mountpoint = part['mountpoint']
-                if mountpoint in ['/', '/boot', '/efi']:
-                    desc += f" ⚠️ {mountpoint} (SYSTEM)"
-                else:
-                    desc += f" @ {mountpoint}"
+        # Fill a new model off-screen and swap it in, so the view is reset only once
+        model = QStandardItemModel(len(items), 1, combo)
+        index_of = {}
+        for i, (text, device) in enumerate(items):
+            item = QStandardItem(text)
+            item.setData(device, Qt.ItemDataRole.UserRole)
+            model.setItem(i, 0, item)
+            index_of.setdefault(device, i)
             
-            self.format_device_combo.addItem(desc, part['device'])
+        # The combo deletes its previous model itself, as it is the model's parent
+        combo.setModel(model)
         
-        # Restore selections if still valid - need to search by stored data
-        for i in range(self.format_device_combo.count()):
-            if self.format_device_combo.itemData(i) == current_format_device:
-                self.format_device_combo.setCurrentIndex(i)
-                break
-                
-        for i in range(self.usb_device_combo.count()):
-            if self.usb_device_combo.itemData(i) == current_usb_device:
-                self.usb_device_combo.setCurrentIndex(i)
-                break
-                
-        # Update the format device info
-        self.update_format_device_info()
+        # Restore selection if still valid
+        index = index_of.get(current_device, -1)
+        if index >= 0:
+            combo.setCurrentIndex(index)
         
     def create_system_info_tab(self):
-        """Create the system information tab with enhanced visual design"""
+        """Create and return the system information tab with enhanced visual design"""
         info_tab = QWidget()
         layout = QVBoxLayout(info_tab)
         
         # Application info section
         app_group = QGroupBox("DiskForge Information")
-        app_group.setStyleSheet("QGroupBox { background-color: #e1f5fe; border-radius: 8px; }")
+        app_group.setStyleSheet(_SYSINFO_APP_GROUP_CSS)
         app_layout = QVBoxLayout(app_group)
         
         # Logo/Title area
@@ -1475,28 +1933,13 @@ class DiskForgeMainWindow(QMainWindow):
         app_layout.addLayout(title_layout)
         
         # Description
-        description = QLabel(
-            "DiskForge is a powerful disk management utility that helps you format drives and "
-            "create bootable Linux USB drives. It works across Linux, macOS, and Windows platforms "
-            "with both graphical and command-line interfaces."
-        )
+        description = QLabel(_SYSINFO_DESCRIPTION)
         description.setWordWrap(True)
         description.setStyleSheet("padding: 10px; color: #333;")
         app_layout.addWidget(description)
         
         # Features list
-        features_text = """
-        <b>Key Features:</b>
-        <ul>
-          <li>Cross-platform support for Linux, macOS, and Windows</li>
-          <li>Format drives with various filesystems (ext4, FAT32, NTFS, exFAT)</li>
-          <li>Create bootable Linux USB drives from ISO images</li>
-          <li>Built-in safety features to prevent accidental data loss</li>
-          <li>Real-time progress tracking with cancellation support</li>
-          <li>Both graphical and command-line interfaces</li>
-        </ul>
-        """
-        features_label = QLabel(features_text)
+        features_label = QLabel(_SYSINFO_FEATURES_HTML)
         features_label.setWordWrap(True)
         features_label.setStyleSheet("padding-left: 10px;")
         app_layout.addWidget(features_label)
@@ -1505,21 +1948,14 @@ class DiskForgeMainWindow(QMainWindow):
         
         # System information section
         sys_group = QGroupBox("System Information")
-        sys_group.setStyleSheet("QGroupBox { background-color: #f5f5f5; border-radius: 8px; }")
+        sys_group.setStyleSheet(_SYSINFO_SYS_GROUP_CSS)
         sys_layout = QVBoxLayout(sys_group)
         
         # System info text area with improved formatting
         self.system_info_text = QTextEdit()
         self.system_info_text.setReadOnly(True)
         self.system_info_text.setFont(QFont("Consolas", 10))
-        self.system_info_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #ffffff;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 10px;
-            }
-        """)
+        self.system_info_text.setStyleSheet(_SYSINFO_TEXTEDIT_CSS)
         sys_layout.addWidget(self.system_info_text)
         
         # Refresh button
@@ -1529,35 +1965,22 @@ class DiskForgeMainWindow(QMainWindow):
         
         layout.addWidget(sys_group)
         
-        self.tab_widget.addTab(info_tab, "ℹ️ System Info")
+        # The tab is built when first shown, so load its contents right away
+        self.refresh_system_info()
+        
+        return info_tab
     
     def refresh_system_info(self):
-        """Refresh system information with enhanced details and formatting"""
-        import platform
-        import psutil
-        
+        """Refresh system information, rebuilding only the memory and disk usage after the first call"""
         try:
-            # System section
-            system_info = f"""<h3>🖥️ System Information</h3>
-<table width="100%" cellpadding="5" style="border-collapse: collapse;">
-    <tr style="background-color: #f0f7ff;">
-        <td width="40%"><b>Operating System:</b></td>
-        <td>{platform.system()} {platform.release()}</td>
-    </tr>
-    <tr>
-        <td><b>Platform:</b></td>
-        <td>{platform.platform()}</td>
-    </tr>
-    <tr style="background-color: #f0f7ff;">
-        <td><b>Architecture:</b></td>
-        <td>{platform.machine()}</td>
-    </tr>
-    <tr>
-        <td><b>Processor:</b></td>
-        <td>{platform.processor() or "Unknown"}</td>
-    </tr>
-</table>"""
-
+            # OS, Python and application details don't change while running
+            if self._static_sysinfo_html is None:
+                self._static_sysinfo_html = self._build_static_sysinfo_html()
+            system_html, details_html = self._static_sysinfo_html
+            
+            buf = io.StringIO()
+            buf.write(system_html)
+            
             # Hardware resources
             try:
                 mem = psutil.virtual_memory()
@@ -1570,7 +1993,7 @@ class DiskForgeMainWindow(QMainWindow):
                 disk_used = self.format_bytes(disk.used)
                 disk_percent = disk.percent
                 
-                hw_info = f"""<h3>💽 Hardware Resources</h3>
+                buf.write(f"""<h3>💽 Hardware Resources</h3>
 <table width="100%" cellpadding="5" style="border-collapse: collapse;">
     <tr style="background-color: #f0f7ff;">
         <td width="40%"><b>Memory (RAM):</b></td>
@@ -1580,12 +2003,52 @@ class DiskForgeMainWindow(QMainWindow):
         <td><b>Disk Space (System):</b></td>
         <td>{disk_used} used of {disk_total} ({disk_percent}%)</td>
     </tr>
-</table>"""
+</table>""")
             except Exception as e:
-                hw_info = f"<h3>💽 Hardware Resources</h3>\n<p>Unable to retrieve hardware info: {str(e)}</p>"
+                buf.write(f"<h3>💽 Hardware Resources</h3>\n<p>Unable to retrieve hardware info: {str(e)}</p>")
+            buf.write("<br>")
+            
+            buf.write(details_html)
+            
+            self.system_info_text.setHtml(buf.getvalue())
+            
+        except Exception as e:
+            self.system_info_text.setPlainText(f"Error retrieving system information: {str(e)}")
             
-            # Python information
-            py_info = f"""<h3>🐍 Python Information</h3>
+    def _build_static_sysinfo_html(self):
+        """
+        Build the parts of the system information that don't change while running
+        
+        Returns:
+            A (system section, Python and DiskForge sections) tuple of HTML strings
+        """
+        # System section
+        buf = io.StringIO()
+        buf.write(f"""<h3>🖥️ System Information</h3>
+<table width="100%" cellpadding="5" style="border-collapse: collapse;">
+    <tr style="background-color: #f0f7ff;">
+        <td width="40%"><b>Operating System:</b></td>
+        <td>{platform.system()} {platform.release()}</td>
+    </tr>
+    <tr>
+        <td><b>Platform:</b></td>
+        <td>{platform.platform()}</td>
+    </tr>
+    <tr style="background-color: #f0f7ff;">
+        <td><b>Architecture:</b></td>
+        <td>{platform.machine()}</td>
+    </tr>
+    <tr>
+        <td><b>Processor:</b></td>
+        <td>{platform.processor() or "Unknown"}</td>
+    </tr>
+</table>""")
+        buf.write("<br>")
+        system_html = buf.getvalue()
+        
+        # Python information
+        buf = io.StringIO()
+        buf.write(f"""<h3>🐍 Python Information</h3>
 <table width="100%" cellpadding="5" style="border-collapse: collapse;">
     <tr style="background-color: #f0f7ff;">
         <td width="40%"><b>Python Version:</b></td>
@@ -1595,10 +2058,11 @@ class DiskForgeMainWindow(QMainWindow):
         <td><b>Implementation:</b></td>
         <td>{platform.python_implementation()}</td>
     </tr>
-</table>"""
-            
-            # DiskForge information
-            app_info = f"""<h3>🔧 DiskForge Information</h3>
+</table>""")
+        buf.write("<br>")
+        
+        # DiskForge information
+        buf.write(f"""<h3>🔧 DiskForge Information</h3>
 <table width="100%" cellpadding="5" style="border-collapse: collapse;">
     <tr style="background-color: #f0f7ff;">
         <td width="40%"><b>Version:</b></td>
@@ -1606,7 +2070,7 @@ class DiskForgeMainWindow(QMainWindow):
     </tr>
     <tr>
         <td><b>Path:</b></td>
-        <td>{os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))}</td>
+        <td>{_APP_ROOT}</td>
     </tr>
     <tr style="background-color: #f0f7ff;">
         <td><b>Mode:</b></td>
@@ -1625,28 +2089,31 @@ class DiskForgeMainWindow(QMainWindow):
     <li>Create bootable Linux USB drives from ISO files</li>
     <li>Monitor disk usage and information</li>
 </ul>
-"""
-            
-            # Combine all sections
-            self.system_info_text.setHtml(f"{system_info}<br>{hw_info}<br>{py_info}<br>{app_info}")
-            
-        except Exception as e:
-            self.system_info_text.setPlainText(f"Error retrieving system information: {str(e)}")
-            
+""")
+        return system_html, buf.getvalue()
+        
     def format_bytes(self, bytes_value):
         """Convert bytes to human-readable format"""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if bytes_value < 1024 or unit == "TB":
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024
+        n = int(bytes_value)
+        if n < 1024:
+            return f"{n}.00 B"
+        # Every 10 bits of the value make one step up the unit list
+        k = min((n.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+        shift = k * 10
+        
+        # Value in hundredths of the unit, rounded half to even like "%.2f" would
+        hundredths, rest = divmod(n * 100, 1 << shift)
+        half = 1 << (shift - 1)
+        if rest > half or (rest == half and hundredths & 1):
+            hundredths += 1
+        whole, frac = divmod(hundredths, 100)
+        return f"{whole}.{frac:02d} {_BYTE_UNITS[k]}"
             
     def check_admin_privileges(self):
         """Check if the application is running with admin/root privileges"""
         try:
-            import platform
-            if platform.system() == "Windows":
+            if ctypes is not None:
                 try:
-                    import ctypes
                     return ctypes.windll.shell32.IsUserAnAdmin() != 0
                 except:
                     return False
@@ -1657,7 +2124,7 @@ class DiskForgeMainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application close"""
-        if self.operation_thread and self.operation_thread.isRunning():
+        if self.current_operation and self.current_operation.is_running:
             reply = QMessageBox.question(
                 self, "Confirm Exit",
                 "An operation is currently running. Are you sure you want to exit?",
@@ -1666,14 +2133,21 @@ class DiskForgeMainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                if self.usb_creator.is_running:
-                    self.usb_creator.cancel()
+                self.current_operation.cancel()
+                self.stop_device_monitor()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.stop_device_monitor()
             event.accept()
     
+    def stop_device_monitor(self):
+        """Stop the udev monitor thread if it is running"""
+        if self.device_observer:
+            self.device_observer.send_stop()
+            self.device_observer = None
+    
     def format_device(self):
         """Format the selected device with improved user feedback"""
         # Get the actual device path from the combo box data
@@ -1735,11 +2209,91 @@ class DiskForgeMainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             self.start_format_operation(device, filesystem)
     
+    def start_format_operation(self, device, filesystem):
+        """Run the format operation on the thread pool"""
+        self.format_btn.setEnabled(False)
+        self.format_progress.setValue(0)
+        self.format_status_label.setText(f"Formatting {device}...")
+        
+        self.current_operation = OperationRunnable(
+            "format", self.disk_manager, self.usb_creator, device, filesystem.lower()
+        )
+        self.current_operation.signals.progress_updated.connect(self.update_format_progress)
+        self.current_operation.signals.operation_finished.connect(self.format_finished)
+        self.current_operation.start(self._operation_pool)
+    
+    def update_format_progress(self, progress, status):
+        """Show format progress reported by the running operation"""
+        self.format_progress.setValue(progress)
+        self.format_status_label.setText(status)
+    
+    def format_finished(self, success, message):
+        """Handle completion of the format operation"""
+        self.format_status_label.setText(message)
+        self.update_format_button_state()
+        
+        if success:
+            QMessageBox.information(self, "Format Complete", message)
+        else:
+            self.format_progress.setValue(0)
+            QMessageBox.critical(self, "Format Failed", message)
+            
+        self.refresh_disk_info()
+    
+    def create_bootable_usb(self):
+        """Run the bootable USB creation on the thread pool"""
+        iso_path = self._iso_path
+        device = self.usb_device_combo.currentData()
+        method = self.method_combo.currentText()
+        
+        if not device or iso_path is None:
+            QMessageBox.warning(self, "Warning", "Please select an ISO file and a USB drive.")
+            return
+            
+        self.usb_progress.setValue(0)
+        
+        self.current_operation = OperationRunnable(
+            "create_usb", self.disk_manager, self.usb_creator, iso_path, device, method
+        )
+        self.current_operation.signals.progress_updated.connect(self.update_usb_progress)
+        self.current_operation.signals.operation_finished.connect(self.usb_creation_finished)
+        self.current_operation.start(self._operation_pool)
+        
+        self.cancel_usb_btn.setEnabled(True)
+        self.update_usb_button_state()
+    
+    def cancel_usb_creation(self):
+        """Cancel the running bootable USB creation"""
+        if self.current_operation and self.current_operation.is_running:
+            self.current_operation.cancel()
+            self.cancel_usb_btn.setEnabled(False)
+            self.usb_status_label.setText("Cancelling...")
+    
+    def update_usb_progress(self, progress, status):
+        """Show USB creation progress reported by the running operation"""
+        self.usb_progress.setValue(progress)
+        self.usb_status_label.setText(status)
+    
+    def usb_creation_finished(self, success, message):
+        """Handle completion of the bootable USB creation"""
+        self.cancel_usb_btn.setEnabled(False)
+        self.update_usb_button_state()
+        self.usb_status_label.setText(message)
+        
+        if success:
+            QMessageBox.information(self, "USB Created", message)
+        else:
+            QMessageBox.critical(self, "USB Creation Failed", message)
+            
+        self.refresh_disk_info()
+    
     def setup_custom_device_view(self):
-        """Setup custom item delegates for device combo boxes to show color indicators"""
-        device_delegate = self.DeviceItemDelegate(self, self.safety_manager)
-        self.format_device_combo.setItemDelegate(device_delegate)
-        self.usb_device_combo.setItemDelegate(device_delegate)
+        """Setup custom item delegates for the device combo boxes built so far to show color indicators"""
+        if self.device_delegate is None:
+            self.device_delegate = self.DeviceItemDelegate(self, self.safety_manager, self._is_safe_device)
+        for combo in (self.format_device_combo, self.usb_device_combo):
+            if combo is not None and combo.itemDelegate() is not self.device_delegate:
+                combo.setItemDelegate(self.device_delegate)
 
 
 def run_gui():
@@ -1747,6 +2301,7 @@ def run_gui():
     app = QApplication(sys.argv)
     app.setApplicationName("DiskForge")
     app.setApplicationVersion("0.1.0")
+    app.setStyleSheet(_load_stylesheet())
     
     # Set application icon (if available)
     # app.setWindowIcon(QIcon("assets/icon.png"))
@@ -1754,9 +2309,6 @@ def run_gui():
     window = DiskForgeMainWindow()
     window.show()
     
-    # Load system info on startup
-    window.refresh_system_info()
-    
     return app.exec()
 
 
@@ -10,6 +10,7 @@ import sys
 import os
 import argparse
 import platform
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add the src directory to the Python path
@@ -20,39 +21,23 @@ def check_dependencies():
     """Check if required dependencies are available"""
     missing_deps = []
     
-    try:
-        import psutil
-    except ImportError:
-        missing_deps.append("psutil")
-    
-    try:
-        import click
-    except ImportError:
-        missing_deps.append("click")
-    
-    try:
-        import colorama
-    except ImportError:
-        missing_deps.append("colorama")
+    # Only locate the modules - they are imported for real when they are used
+    for module in ("psutil", "click", "colorama"):
+        if find_spec(module) is None:
+            missing_deps.append(module)
     
     # Platform-specific dependencies
-    if platform.system() == "Linux":
-        try:
-            import pyudev
-        except ImportError:
+    system = platform.system()
+    if system == "Linux":
+        if find_spec("pyudev") is None:
             missing_deps.append("pyudev (Linux)")
     
-    elif platform.system() == "Darwin":
-        try:
-            import objc
-        except ImportError:
+    elif system == "Darwin":
+        if find_spec("objc") is None:
             missing_deps.append("pyobjc (macOS)")
     
-    elif platform.system() == "Windows":
-        try:
-            import win32api
-            import wmi
-        except ImportError:
+    elif system == "Windows":
+        if find_spec("win32api") is None or find_spec("wmi") is None:
             missing_deps.append("pywin32 and wmi (Windows)")
     
     if missing_deps:
@@ -99,6 +84,7 @@ def run_cli():
 def run_gui():
     """Run the graphical user interface"""
     try:
+        # PyQt6 and the GUI modules are only imported here, so CLI mode never loads them
         # Check if PyQt6 is available
         try:
             from PyQt6.QtWidgets import QApplication